@@ -1,7 +1,7 @@
 #![cfg_attr(not(debug_assertions), windows_subsystem = "windows")]
 
-use aes_gcm::aead::{rand_core::RngCore, Aead, OsRng};
-use aes_gcm::{Aes256Gcm, KeyInit, Nonce};
+use aes_gcm::aead::{rand_core::RngCore, AeadInPlace, OsRng};
+use aes_gcm::{Aes256Gcm, KeyInit, Nonce, Tag};
 use base64::engine::general_purpose::STANDARD as B64;
 use base64::Engine;
 use pbkdf2::pbkdf2_hmac;
@@ -10,8 +10,10 @@ use serde_json::json;
 use sha2::{Digest, Sha256};
 use std::collections::{HashMap, HashSet};
 use std::fs;
+use std::io::{Read, Write};
 use std::path::{Component, Path, PathBuf};
-use std::sync::{Mutex, OnceLock};
+use std::sync::atomic::{AtomicU64, Ordering};
+use std::sync::{Mutex, MutexGuard, OnceLock};
 use std::time::{SystemTime, UNIX_EPOCH};
 use tauri::{AppHandle, Manager, Window};
 use tauri_plugin_clipboard_manager::ClipboardExt;
@@ -22,6 +24,7 @@ const DATA_FILE: &str = "workflow.enc";
 const META_FILE: &str = "meta.json";
 const EMAIL_TEMPLATES_FILE: &str = "email_templates.json";
 const DEFAULT_PBKDF2_ITERATIONS: u32 = 200_000;
+const KDF_CACHE_LIMIT: usize = 4;
 const DB_VERSION: u8 = 3;
 const DB_TABLE_ORDER: [&str; 6] = [
     "kanban_columns",
@@ -153,6 +156,42 @@ const SENSITIVE_PII_FIELDS: [&str; 29] = [
     "Additional Notes",
 ];
 const SENSITIVE_CARD_FIELDS: [&str; 2] = ["icims_id", "employee_id"];
+const UNIFORM_KEY_FIELDS: [&str; 4] = ["branch", "type", "size", "alteration"];
+
+struct StoragePaths {
+    root: PathBuf,
+    auth: PathBuf,
+    data: PathBuf,
+    meta: PathBuf,
+    email_templates: PathBuf,
+}
+
+struct MetaCacheEntry {
+    modified: Option<SystemTime>,
+    len: u64,
+    value: serde_json::Value,
+}
+
+struct AuthCacheEntry {
+    modified: Option<SystemTime>,
+    len: u64,
+    record: Option<AuthRecord>,
+}
+
+struct SourceCacheEntry {
+    filename: String,
+    password_key: String,
+    modified: Option<SystemTime>,
+    len: u64,
+    value: serde_json::Value,
+}
+
+struct KdfCacheEntry {
+    password_digest: [u8; 32],
+    salt: Vec<u8>,
+    iterations: u32,
+    key: [u8; 32],
+}
 
 #[derive(Default)]
 struct DbCacheState {
@@ -300,6 +339,18 @@ struct DbKanbanReorderRequest {
     card_ids: Vec<String>,
 }
 
+#[derive(Deserialize)]
+struct DbKanbanMoveCardRequest {
+    password: String,
+    card_id: String,
+    column_id: String,
+    card_ids: Vec<String>,
+    #[serde(default)]
+    from_column_id: String,
+    #[serde(default)]
+    from_card_ids: Vec<String>,
+}
+
 #[derive(Deserialize)]
 struct DbUniformsAddItemRequest {
     password: String,
@@ -412,7 +463,7 @@ struct CryptoEnvelope {
     data: String,
 }
 
-#[derive(Serialize, Deserialize)]
+#[derive(Clone, Serialize, Deserialize)]
 struct AuthRecord {
     salt: String,
     hash: String,
@@ -630,7 +681,18 @@ fn pick_text_file() -> Result<PickTextFileResult, String> {
         });
     };
 
-    let data = fs::read_to_string(&path).map_err(|err| err.to_string())?;
+    let data = match fs::read_to_string(&path) {
+        Ok(value) => value,
+        Err(err) => {
+            return Ok(PickTextFileResult {
+                ok: false,
+                canceled: false,
+                name: None,
+                data: None,
+                error: Some(err.to_string()),
+            });
+        }
+    };
     let name = path
         .file_name()
         .map(|value| value.to_string_lossy().to_string())
@@ -662,7 +724,15 @@ fn save_csv_file(payload: SaveCsvRequest) -> Result<SaveCsvResult, String> {
         });
     };
 
-    write_text_file(path.clone(), payload.content.as_str())?;
+    if let Err(err) = write_text_file(path.clone(), payload.content.as_str()) {
+        return Ok(SaveCsvResult {
+            ok: false,
+            canceled: false,
+            filename: default_name,
+            path: None,
+            error: Some(err),
+        });
+    }
     Ok(SaveCsvResult {
         ok: true,
         canceled: false,
@@ -676,7 +746,10 @@ fn save_csv_file(payload: SaveCsvRequest) -> Result<SaveCsvResult, String> {
 fn db_export_csv(payload: DbExportCsvRequest) -> Result<SaveCsvResult, String> {
     let filename = sanitize_export_filename(payload.filename.as_str());
     let mut columns = sanitize_export_columns(&payload.columns);
-    let mut rows = payload.rows.as_array().cloned().unwrap_or_default();
+    let mut rows = match payload.rows {
+        serde_json::Value::Array(items) => items,
+        _ => Vec::new(),
+    };
     if rows.len() > 50_000 {
         rows.truncate(50_000);
     }
@@ -717,19 +790,20 @@ fn storage_read_text(
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
-    if !path.exists() {
-        return Ok(None);
+    match fs::read_to_string(path) {
+        Ok(data) => Ok(Some(data)),
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => Ok(None),
+        Err(err) => Err(err.to_string()),
     }
-    let data = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    Ok(Some(data))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn storage_write_text(app: AppHandle, payload: StorageWriteRequest) -> Result<bool, String> {
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
-    write_text_file(path, payload.text.as_str())?;
+    let _write = storage_write_lock();
+    write_text_file_if_changed(path, payload.text.as_str())?;
     Ok(true)
 }
 
@@ -741,27 +815,27 @@ fn storage_read_json(
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
-    if !path.exists() {
+    let Some(data) = read_optional_file(path.as_path())? else {
         return Ok(None);
-    }
-    let data = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    match serde_json::from_str::<serde_json::Value>(data.as_str()) {
+    };
+    match serde_json::from_slice::<serde_json::Value>(data.as_slice()) {
         Ok(value) => Ok(Some(value)),
         Err(_) => Ok(None),
     }
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn storage_write_json(app: AppHandle, payload: StorageWriteJsonRequest) -> Result<bool, String> {
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
     let content = serde_json::to_string_pretty(&payload.value).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())?;
+    let _write = storage_write_lock();
+    write_text_file_if_changed(path, content.as_str())?;
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn storage_read_encrypted_json(
     app: AppHandle,
     payload: StorageEncryptedReadRequest,
@@ -769,18 +843,17 @@ fn storage_read_encrypted_json(
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
-    if !path.exists() {
+    let Some(raw) = read_optional_file(path.as_path())? else {
         return Ok(None);
-    }
-    let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    let envelope: CryptoEnvelope = match serde_json::from_str(raw.as_str()) {
+    };
+    let envelope: CryptoEnvelope = match serde_json::from_slice(raw.as_slice()) {
         Ok(value) => value,
         Err(_) => return Ok(None),
     };
     decrypt_envelope(&envelope, payload.password.as_str())
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn storage_write_encrypted_json(
     app: AppHandle,
     payload: StorageEncryptedWriteRequest,
@@ -788,13 +861,13 @@ fn storage_write_encrypted_json(
     let root = storage_root_dir(&app)?;
     let rel = sanitize_relative_path(payload.name.as_str())?;
     let path = root.join(rel);
-    let envelope = encrypt_text(payload.text.as_str(), payload.password.as_str())?;
-    let content = serde_json::to_string_pretty(&envelope).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())?;
+    let envelope = encrypt_bytes(payload.text.into_bytes(), payload.password.as_str())?;
+    let _write = storage_write_lock();
+    write_envelope_file(path, &envelope)?;
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_todos_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::Value, String> {
     let db = load_db_value(&app, payload.password.as_str())?;
     let todos = db.get("todos").cloned().unwrap_or_else(|| json!([]));
@@ -805,7 +878,7 @@ fn db_todos_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::Va
     }
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_dashboard_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::Value, String> {
     let db = load_db_value(&app, payload.password.as_str())?;
     let columns = db
@@ -829,8 +902,9 @@ fn db_dashboard_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_todos_set(app: AppHandle, payload: DbTodosSetRequest) -> Result<bool, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let todos = if payload.todos.is_array() {
         payload.todos
@@ -842,8 +916,9 @@ fn db_todos_set(app: AppHandle, payload: DbTodosSetRequest) -> Result<bool, Stri
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_weekly_get(app: AppHandle, payload: DbWeeklyGetRequest) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let week_start = payload.week_start.trim().to_string();
     let week_end = payload.week_end.trim().to_string();
@@ -902,8 +977,9 @@ fn db_weekly_get(app: AppHandle, payload: DbWeeklyGetRequest) -> Result<serde_js
     Ok(out)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_weekly_set(app: AppHandle, payload: DbWeeklySetRequest) -> Result<bool, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let week_start = payload.week_start.trim();
     if week_start.is_empty() {
@@ -933,7 +1009,7 @@ fn db_weekly_set(app: AppHandle, payload: DbWeeklySetRequest) -> Result<bool, St
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_weekly_summary(
     app: AppHandle,
     payload: DbWeeklyGetRequest,
@@ -987,33 +1063,31 @@ fn db_weekly_summary_save(
 
 #[tauri::command]
 fn email_templates_get(app: AppHandle) -> Result<serde_json::Value, String> {
-    let root = storage_root_dir(&app)?;
-    let path = root.join(EMAIL_TEMPLATES_FILE);
-    if !path.exists() {
+    let path = email_templates_file_path(&app)?;
+    let Some(raw) = read_optional_file(path.as_path())? else {
         return Ok(json!({}));
-    }
-    let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    match serde_json::from_str::<serde_json::Value>(raw.as_str()) {
+    };
+    match serde_json::from_slice::<serde_json::Value>(raw.as_slice()) {
         Ok(value) => Ok(value),
         Err(_) => Ok(json!({})),
     }
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn email_templates_set(app: AppHandle, payload: EmailTemplatesSetRequest) -> Result<bool, String> {
-    let root = storage_root_dir(&app)?;
-    let path = root.join(EMAIL_TEMPLATES_FILE);
+    let path = email_templates_file_path(&app)?;
     let value = if payload.value.is_object() {
         payload.value
     } else {
         json!({})
     };
     let content = serde_json::to_string_pretty(&value).map_err(|err| err.to_string())?;
+    let _write = storage_write_lock();
     write_text_file(path, content.as_str())?;
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_list_tables(app: AppHandle, payload: DbAuthRequest) -> Result<Vec<DbTableInfo>, String> {
     let db = load_db_value(&app, payload.password.as_str())?;
     let mut out = Vec::new();
@@ -1027,14 +1101,14 @@ fn db_list_tables(app: AppHandle, payload: DbAuthRequest) -> Result<Vec<DbTableI
     Ok(out)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_get_table(app: AppHandle, payload: DbGetTableRequest) -> Result<DbTableResult, String> {
     let db = load_db_value(&app, payload.password.as_str())?;
     let table_id = payload.table_id.trim();
     Ok(build_db_table(&db, table_id))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_sources_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::Value, String> {
     if payload.password.trim().is_empty() {
         return Err("Password is required.".to_string());
@@ -1071,7 +1145,7 @@ fn db_set_source(app: AppHandle, payload: DbSourceSetRequest) -> Result<serde_js
     Ok(json!({ "ok": true, "activeId": next_id }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_list_tables_source(
     app: AppHandle,
     payload: DbSourceTableListRequest,
@@ -1092,7 +1166,7 @@ fn db_list_tables_source(
     Ok(out)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_get_table_source(
     app: AppHandle,
     payload: DbSourceTableRequest,
@@ -1111,11 +1185,12 @@ fn db_get_table_source(
     Ok(build_db_table(&db, table_id))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_import_apply(
     app: AppHandle,
     payload: DbImportApplyRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let action = clamp_string(payload.action.as_str(), 20, true).to_lowercase();
     if action != "append" && action != "view" && action != "replace" {
         return Ok(json!({
@@ -1222,7 +1297,7 @@ fn db_import_apply(
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::Value, String> {
     let db = load_db_value(&app, payload.password.as_str())?;
     let columns = db
@@ -1244,11 +1319,12 @@ fn db_kanban_get(app: AppHandle, payload: DbAuthRequest) -> Result<serde_json::V
     Ok(json!({ "columns": columns, "cards": cards }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_add_column(
     app: AppHandle,
     payload: DbKanbanAddColumnRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let name = clamp_string(payload.name.as_str(), 60, true);
     let columns_now = db
@@ -1284,11 +1360,12 @@ fn db_kanban_add_column(
     Ok(json!({ "ok": true, "columns": out_columns }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_remove_column(
     app: AppHandle,
     payload: DbKanbanColumnRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let column_id = clamp_string(payload.column_id.as_str(), 128, true);
     if column_id.is_empty() {
@@ -1305,11 +1382,12 @@ fn db_kanban_remove_column(
     Ok(result)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_add_card(
     app: AppHandle,
     payload: DbKanbanAddCardRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let card_payload = payload.payload;
     let column_id = clamp_string(
@@ -1416,11 +1494,12 @@ fn db_kanban_add_card(
     Ok(json!({ "ok": true, "card": card }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_update_card(
     app: AppHandle,
     payload: DbKanbanUpdateCardRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let card_id = clamp_string(payload.id.as_str(), 128, true);
     if card_id.is_empty() {
@@ -1522,8 +1601,9 @@ fn db_kanban_update_card(
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_pii_get(app: AppHandle, payload: DbPiiRequest) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let candidate_id = clamp_string(payload.candidate_id.as_str(), 128, true);
     if candidate_id.is_empty() {
@@ -1563,8 +1643,9 @@ fn db_pii_get(app: AppHandle, payload: DbPiiRequest) -> Result<serde_json::Value
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_pii_save(app: AppHandle, payload: DbPiiSaveRequest) -> Result<bool, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let candidate_id = clamp_string(payload.candidate_id.as_str(), 128, true);
     if candidate_id.is_empty() {
@@ -1598,11 +1679,12 @@ fn db_pii_save(app: AppHandle, payload: DbPiiSaveRequest) -> Result<bool, String
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_process_candidate(
     app: AppHandle,
     payload: DbKanbanProcessCandidateRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let candidate_id = clamp_string(payload.candidate_id.as_str(), 128, true);
     if candidate_id.is_empty() {
@@ -1861,11 +1943,12 @@ fn db_kanban_process_candidate(
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_remove_candidate(
     app: AppHandle,
     payload: DbPiiRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let candidate_id = clamp_string(payload.candidate_id.as_str(), 128, true);
     if candidate_id.is_empty() {
@@ -1909,69 +1992,64 @@ fn db_kanban_remove_candidate(
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_kanban_reorder_column(
     app: AppHandle,
     payload: DbKanbanReorderRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let column_id = clamp_string(payload.column_id.as_str(), 128, true);
-    let ordered_ids: Vec<String> = payload
-        .card_ids
-        .into_iter()
-        .map(|id| clamp_string(id.as_str(), 128, true))
-        .filter(|id| !id.is_empty())
-        .collect();
-    let cards = db_kanban_cards_mut(&mut db)?;
+    let now = now_string();
+    reorder_kanban_column(
+        db_kanban_cards_mut(&mut db)?,
+        column_id.as_str(),
+        payload.card_ids,
+        now.as_str(),
+    );
 
-    let mut column_cards: Vec<serde_json::Value> = cards
+    save_db_value(&app, payload.password.as_str(), &db)?;
+    Ok(json!({
+        "cards": db.get("kanban").and_then(|v| v.get("cards")).cloned().unwrap_or_else(|| json!([])),
+    }))
+}
+
+#[tauri::command(async)]
+fn db_kanban_move_card(
+    app: AppHandle,
+    payload: DbKanbanMoveCardRequest,
+) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
+    let mut db = load_db_value(&app, payload.password.as_str())?;
+    let card_id = clamp_string(payload.card_id.as_str(), 128, true);
+    let column_id = clamp_string(payload.column_id.as_str(), 128, true);
+    let from_column_id = clamp_string(payload.from_column_id.as_str(), 128, true);
+    let valid_columns: HashSet<String> = db_kanban_columns_mut(&mut db)?
         .iter()
-        .filter(|card| value_ref_string(card.get("column_id")) == column_id)
-        .cloned()
+        .map(|col| value_ref_string(col.get("id")))
         .collect();
-    let mut by_id = std::collections::HashMap::new();
-    for card in &column_cards {
-        by_id.insert(value_ref_string(card.get("uuid")), card.clone());
-    }
-
-    let mut ordered = Vec::new();
-    let mut seen = HashSet::new();
-    for id in ordered_ids {
-        if seen.contains(&id) {
-            continue;
-        }
-        if let Some(card) = by_id.get(&id) {
-            ordered.push(card.clone());
-            seen.insert(id);
-        }
-    }
-
-    column_cards.sort_by_key(|card| value_i64(card.get("order")));
-    for card in column_cards {
-        let card_id = value_ref_string(card.get("uuid"));
-        if !seen.contains(&card_id) {
-            ordered.push(card);
-        }
-    }
-
     let now = now_string();
-    let mut order_by_id = std::collections::HashMap::new();
-    for (idx, card) in ordered.iter().enumerate() {
-        order_by_id.insert(value_ref_string(card.get("uuid")), (idx + 1) as i64);
-    }
 
-    for card in cards.iter_mut() {
-        if value_ref_string(card.get("column_id")) != column_id {
-            continue;
-        }
-        let id = value_ref_string(card.get("uuid"));
-        if let Some(next_order) = order_by_id.get(&id).copied() {
-            if let Some(card_obj) = card.as_object_mut() {
-                card_obj.insert("order".to_string(), json!(next_order));
-                card_obj.insert("updated_at".to_string(), json!(now.clone()));
-            }
+    let cards = db_kanban_cards_mut(&mut db)?;
+    if !card_id.is_empty() {
+        if let Some(card_obj) = cards
+            .iter_mut()
+            .find(|card| value_ref_string(card.get("uuid")) == card_id)
+            .and_then(|card| card.as_object_mut())
+        {
+            apply_card_updates(card_obj, &json!({ "column_id": column_id }), &valid_columns);
+            card_obj.insert("updated_at".to_string(), json!(now));
         }
     }
+    reorder_kanban_column(cards, column_id.as_str(), payload.card_ids, now.as_str());
+    if !from_column_id.is_empty() && from_column_id != column_id {
+        reorder_kanban_column(
+            cards,
+            from_column_id.as_str(),
+            payload.from_card_ids,
+            now.as_str(),
+        );
+    }
 
     save_db_value(&app, payload.password.as_str(), &db)?;
     Ok(json!({
@@ -1979,11 +2057,12 @@ fn db_kanban_reorder_column(
     }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_uniforms_add_item(
     app: AppHandle,
     payload: DbUniformsAddItemRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let normalized = normalize_uniform_payload(&payload.payload);
 
@@ -2014,11 +2093,12 @@ fn db_uniforms_add_item(
     Ok(json!({ "ok": true, "row": row }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_delete_rows(
     app: AppHandle,
     payload: DbDeleteRowsRequest,
 ) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let table_id = clamp_string(payload.table_id.as_str(), 128, true);
     let ids: HashSet<String> = payload
@@ -2160,7 +2240,7 @@ fn db_delete_rows(
     Ok(json!({ "ok": true, "undoId": undo_id }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_validate_current(
     app: AppHandle,
     payload: DbAuthRequest,
@@ -2177,8 +2257,9 @@ fn db_validate_current(
     Ok(json!({ "ok": true }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_recycle_undo(app: AppHandle, payload: DbRecycleRequest) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let id = clamp_string(payload.id.as_str(), 128, true);
     if id.is_empty() {
@@ -2196,8 +2277,9 @@ fn db_recycle_undo(app: AppHandle, payload: DbRecycleRequest) -> Result<serde_js
     Ok(json!({ "ok": true, "redoId": redo_id }))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn db_recycle_redo(app: AppHandle, payload: DbRecycleRequest) -> Result<serde_json::Value, String> {
+    let _write = db_write_lock();
     let mut db = load_db_value(&app, payload.password.as_str())?;
     let id = clamp_string(payload.id.as_str(), 128, true);
     if id.is_empty() {
@@ -2220,7 +2302,7 @@ fn auth_read(app: AppHandle) -> Result<Option<AuthRecord>, String> {
     read_auth_record(&app)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn auth_setup(app: AppHandle, payload: AuthSetupRequest) -> Result<AuthRecord, String> {
     let password = payload.password;
     if password.is_empty() {
@@ -2242,27 +2324,15 @@ fn auth_setup(app: AppHandle, payload: AuthSetupRequest) -> Result<AuthRecord, S
     Ok(record)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn auth_verify(app: AppHandle, payload: AuthVerifyRequest) -> Result<bool, String> {
     let Some(record) = read_auth_record(&app)? else {
         return Ok(false);
     };
-    if payload.password.is_empty() {
-        return Ok(false);
-    }
-    let salt = match decode_b64(record.salt.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(false),
-    };
-    let key = derive_key(
-        payload.password.as_str(),
-        salt.as_slice(),
-        record.iterations.max(1),
-    );
-    Ok(encode_b64(key.as_slice()) == record.hash)
+    Ok(password_matches_record(&record, payload.password.as_str()))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn auth_change(app: AppHandle, payload: AuthChangeRequest) -> Result<bool, String> {
     let Some(current_record) = read_auth_record(&app)? else {
         return Ok(false);
@@ -2270,16 +2340,7 @@ fn auth_change(app: AppHandle, payload: AuthChangeRequest) -> Result<bool, Strin
     if payload.current.is_empty() || payload.next.is_empty() {
         return Ok(false);
     }
-    let salt = match decode_b64(current_record.salt.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(false),
-    };
-    let current_key = derive_key(
-        payload.current.as_str(),
-        salt.as_slice(),
-        current_record.iterations.max(1),
-    );
-    if encode_b64(current_key.as_slice()) != current_record.hash {
+    if !password_matches_record(&current_record, payload.current.as_str()) {
         return Ok(false);
     }
 
@@ -2299,7 +2360,7 @@ fn auth_change(app: AppHandle, payload: AuthChangeRequest) -> Result<bool, Strin
     Ok(true)
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn crypto_hash_password(payload: CryptoHashPasswordRequest) -> Result<String, String> {
     let iterations = payload
         .iterations
@@ -2310,12 +2371,12 @@ fn crypto_hash_password(payload: CryptoHashPasswordRequest) -> Result<String, St
     Ok(encode_b64(key.as_slice()))
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn crypto_encrypt_json(payload: CryptoEncryptRequest) -> Result<CryptoEnvelope, String> {
-    encrypt_text(payload.text.as_str(), payload.password.as_str())
+    encrypt_bytes(payload.text.into_bytes(), payload.password.as_str())
 }
 
-#[tauri::command]
+#[tauri::command(async)]
 fn crypto_decrypt_json(payload: CryptoDecryptRequest) -> Result<Option<String>, String> {
     let envelope = CryptoEnvelope {
         v: 1,
@@ -2415,12 +2476,20 @@ fn clamp_string(value: &str, max_len: usize, trim: bool) -> String {
 }
 
 fn parse_military_time(value: &str) -> Option<i64> {
-    let digits: String = value.chars().filter(|ch| ch.is_ascii_digit()).collect();
-    if digits.len() != 4 {
+    let mut digits = [0i64; 4];
+    let mut count = 0;
+    for byte in value.bytes().filter(u8::is_ascii_digit) {
+        if count == digits.len() {
+            return None;
+        }
+        digits[count] = i64::from(byte - b'0');
+        count += 1;
+    }
+    if count != digits.len() {
         return None;
     }
-    let hours = digits[0..2].parse::<i64>().ok()?;
-    let minutes = digits[2..4].parse::<i64>().ok()?;
+    let hours = digits[0] * 10 + digits[1];
+    let minutes = digits[2] * 10 + digits[3];
     if !(0..=23).contains(&hours) || !(0..=59).contains(&minutes) {
         return None;
     }
@@ -2480,14 +2549,8 @@ fn parse_weekly_time(value: &str) -> Option<i64> {
         return None;
     }
 
-    let (mut hours, minutes) = if cleaned.contains(':') {
-        let parts: Vec<&str> = cleaned.split(':').collect();
-        if parts.len() != 2 {
-            return None;
-        }
-        let h = parts[0].parse::<i64>().ok()?;
-        let m = parts[1].parse::<i64>().ok()?;
-        (h, m)
+    let (mut hours, minutes) = if let Some((h, m)) = cleaned.split_once(':') {
+        (h.parse::<i64>().ok()?, m.parse::<i64>().ok()?)
     } else {
         let digits = cleaned.as_str();
         match digits.len() {
@@ -2749,6 +2812,66 @@ fn ensure_candidate_row<'a>(
         .ok_or_else(|| "Unable to create candidate row.".to_string())
 }
 
+fn reorder_kanban_column(
+    cards: &mut [serde_json::Value],
+    column_id: &str,
+    card_ids: Vec<String>,
+    now: &str,
+) {
+    let ordered_ids: Vec<String> = card_ids
+        .into_iter()
+        .map(|id| clamp_string(id.as_str(), 128, true))
+        .filter(|id| !id.is_empty())
+        .collect();
+    let mut column_cards: Vec<serde_json::Value> = cards
+        .iter()
+        .filter(|card| value_ref_string(card.get("column_id")) == column_id)
+        .cloned()
+        .collect();
+    let mut by_id = std::collections::HashMap::new();
+    for card in &column_cards {
+        by_id.insert(value_ref_string(card.get("uuid")), card.clone());
+    }
+
+    let mut ordered = Vec::new();
+    let mut seen = HashSet::new();
+    for id in ordered_ids {
+        if seen.contains(&id) {
+            continue;
+        }
+        if let Some(card) = by_id.get(&id) {
+            ordered.push(card.clone());
+            seen.insert(id);
+        }
+    }
+
+    column_cards.sort_by_key(|card| value_i64(card.get("order")));
+    for card in column_cards {
+        let card_id = value_ref_string(card.get("uuid"));
+        if !seen.contains(&card_id) {
+            ordered.push(card);
+        }
+    }
+
+    let mut order_by_id = std::collections::HashMap::new();
+    for (idx, card) in ordered.iter().enumerate() {
+        order_by_id.insert(value_ref_string(card.get("uuid")), (idx + 1) as i64);
+    }
+
+    for card in cards.iter_mut() {
+        if value_ref_string(card.get("column_id")) != column_id {
+            continue;
+        }
+        let id = value_ref_string(card.get("uuid"));
+        if let Some(next_order) = order_by_id.get(&id).copied() {
+            if let Some(card_obj) = card.as_object_mut() {
+                card_obj.insert("order".to_string(), json!(next_order));
+                card_obj.insert("updated_at".to_string(), json!(now));
+            }
+        }
+    }
+}
+
 fn apply_card_updates(
     card_obj: &mut serde_json::Map<String, serde_json::Value>,
     payload: &serde_json::Value,
@@ -2884,10 +3007,9 @@ fn remove_kanban_columns(
 
 fn normalize_uniform_type(value: &str) -> String {
     let text = clamp_string(value, 40, true);
-    let lowered = text.to_lowercase();
-    if lowered == "shirts" {
+    if text.eq_ignore_ascii_case("shirts") {
         "Shirt".to_string()
-    } else if lowered == "pants" {
+    } else if text.eq_ignore_ascii_case("pants") {
         "Pants".to_string()
     } else {
         text
@@ -2933,22 +3055,26 @@ fn normalize_uniform_payload(payload: &serde_json::Value) -> UniformPayload {
     }
 }
 
-fn uniform_key_from_entry(entry: &serde_json::Value) -> String {
-    let branch = value_ref_string(entry.get("branch")).to_lowercase();
-    let kind = value_ref_string(entry.get("type")).to_lowercase();
-    let size = value_ref_string(entry.get("size")).to_lowercase();
-    let alteration = value_ref_string(entry.get("alteration")).to_lowercase();
-    format!("{branch}|{kind}|{size}|{alteration}")
-}
-
-fn uniform_key_from_payload(payload: &UniformPayload) -> String {
-    format!(
-        "{}|{}|{}|{}",
+fn uniform_key_from_payload(payload: &UniformPayload) -> [String; 4] {
+    [
         payload.branch.to_lowercase(),
         payload.kind.to_lowercase(),
         payload.size.to_lowercase(),
-        payload.alteration.to_lowercase()
-    )
+        payload.alteration.to_lowercase(),
+    ]
+}
+
+fn uniform_entry_matches_key(entry: &serde_json::Value, key: &[String; 4]) -> bool {
+    UNIFORM_KEY_FIELDS
+        .iter()
+        .zip(key.iter())
+        .all(|(field, expected)| match entry.get(*field) {
+            Some(serde_json::Value::String(text)) => text
+                .chars()
+                .flat_map(char::to_lowercase)
+                .eq(expected.chars()),
+            other => value_ref_string(other).to_lowercase() == *expected,
+        })
 }
 
 fn upsert_uniform_stock(
@@ -2958,7 +3084,7 @@ fn upsert_uniform_stock(
     let uniforms = db_uniforms_mut(db).ok()?;
     let key = uniform_key_from_payload(payload);
     for entry in uniforms.iter_mut() {
-        if uniform_key_from_entry(entry) != key {
+        if !uniform_entry_matches_key(entry, &key) {
             continue;
         }
         if let Some(entry_obj) = entry.as_object_mut() {
@@ -2991,7 +3117,7 @@ fn decrement_uniform_stock(db: &mut serde_json::Value, payload: &UniformPayload)
         let Some(entry) = uniforms.get(idx) else {
             continue;
         };
-        if uniform_key_from_entry(entry) != key {
+        if !uniform_entry_matches_key(entry, &key) {
             continue;
         }
         let available = value_i64(uniforms[idx].get("quantity")).max(0);
@@ -3058,7 +3184,7 @@ fn append_uniform_adjustment(
     }
     let key = uniform_key_from_payload(payload);
     for entry in adjustments.iter_mut() {
-        if uniform_key_from_entry(entry) != key {
+        if !uniform_entry_matches_key(entry, &key) {
             continue;
         }
         if let Some(obj) = entry.as_object_mut() {
@@ -3153,10 +3279,8 @@ fn push_recycle_item(db: &mut serde_json::Value, payload: serde_json::Value) ->
     let mut entry = serde_json::Map::new();
     entry.insert("id".to_string(), json!(id.clone()));
     entry.insert("deleted_at".to_string(), json!(now_string()));
-    if let Some(obj) = payload.as_object() {
-        for (key, value) in obj {
-            entry.insert(key.clone(), value.clone());
-        }
+    if let serde_json::Value::Object(obj) = payload {
+        entry.extend(obj);
     }
     let items = db_recycle_items_mut(db).ok()?;
     items.push(serde_json::Value::Object(entry));
@@ -3168,10 +3292,8 @@ fn push_redo_item(db: &mut serde_json::Value, payload: serde_json::Value) -> Opt
     let mut entry = serde_json::Map::new();
     entry.insert("id".to_string(), json!(id.clone()));
     entry.insert("deleted_at".to_string(), json!(now_string()));
-    if let Some(obj) = payload.as_object() {
-        for (key, value) in obj {
-            entry.insert(key.clone(), value.clone());
-        }
+    if let serde_json::Value::Object(obj) = payload {
+        entry.extend(obj);
     }
     let redo = db_redo_items_mut(db).ok()?;
     redo.push(serde_json::Value::Object(entry));
@@ -3633,20 +3755,23 @@ fn verify_auth_password(app: &AppHandle, password: &str) -> Result<bool, String>
     let Some(record) = read_auth_record(app)? else {
         return Ok(false);
     };
+    Ok(password_matches_record(&record, password))
+}
+
+fn password_matches_record(record: &AuthRecord, password: &str) -> bool {
     if password.is_empty() {
-        return Ok(false);
+        return false;
     }
     let salt = match decode_b64(record.salt.as_str()) {
         Ok(value) => value,
-        Err(_) => return Ok(false),
+        Err(_) => return false,
     };
-    let key = derive_key(password, salt.as_slice(), record.iterations.max(1));
-    Ok(encode_b64(key.as_slice()) == record.hash)
+    let key = derive_key_cached(password, salt.as_slice(), record.iterations.max(1));
+    encode_b64(key.as_slice()) == record.hash
 }
 
 fn meta_file_path(app: &AppHandle) -> Result<PathBuf, String> {
-    let root = storage_root_dir(app)?;
-    Ok(root.join(META_FILE))
+    Ok(storage_paths(app)?.meta.clone())
 }
 
 fn ensure_meta_shape_value(value: serde_json::Value) -> serde_json::Value {
@@ -3673,24 +3798,54 @@ fn ensure_meta_shape_value(value: serde_json::Value) -> serde_json::Value {
     out
 }
 
+fn meta_cache() -> &'static Mutex<Option<MetaCacheEntry>> {
+    static CACHE: OnceLock<Mutex<Option<MetaCacheEntry>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(None))
+}
+
+fn store_cached_meta(metadata: &fs::Metadata, value: &serde_json::Value) {
+    if let Ok(mut guard) = meta_cache().lock() {
+        *guard = Some(MetaCacheEntry {
+            modified: metadata.modified().ok(),
+            len: metadata.len(),
+            value: value.clone(),
+        });
+    }
+}
+
 fn load_meta_value(app: &AppHandle) -> Result<serde_json::Value, String> {
     let path = meta_file_path(app)?;
-    if !path.exists() {
+    let Ok(metadata) = fs::metadata(path.as_path()) else {
         return Ok(ensure_meta_shape_value(json!({})));
+    };
+    if let Ok(guard) = meta_cache().lock() {
+        if let Some(entry) = guard.as_ref() {
+            if entry.modified == metadata.modified().ok() && entry.len == metadata.len() {
+                return Ok(entry.value.clone());
+            }
+        }
     }
-    let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    let parsed = match serde_json::from_str::<serde_json::Value>(raw.as_str()) {
+    let Some(raw) = read_optional_file(path.as_path())? else {
+        return Ok(ensure_meta_shape_value(json!({})));
+    };
+    let parsed = match serde_json::from_slice::<serde_json::Value>(raw.as_slice()) {
         Ok(value) => value,
         Err(_) => json!({}),
     };
-    Ok(ensure_meta_shape_value(parsed))
+    let out = ensure_meta_shape_value(parsed);
+    store_cached_meta(&metadata, &out);
+    Ok(out)
 }
 
 fn write_meta_value(app: &AppHandle, value: &serde_json::Value) -> Result<(), String> {
     let path = meta_file_path(app)?;
     let normalized = ensure_meta_shape_value(value.clone());
     let content = serde_json::to_string(&normalized).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())
+    write_text_file(path.clone(), content.as_str())?;
+    if let Ok(metadata) = fs::metadata(path.as_path()) {
+        store_cached_meta(&metadata, &normalized);
+    }
+    Ok(())
 }
 
 fn list_db_sources(meta: &serde_json::Value) -> Vec<serde_json::Value> {
@@ -3785,8 +3940,11 @@ fn read_db_file_by_name(
         Ok(value) => value,
         Err(_) => return Ok(None),
     };
-    if !path.exists() {
+    let Ok(metadata) = fs::metadata(path.as_path()) else {
         return Ok(None);
+    };
+    if let Some(cached) = load_cached_source(filename, password, &metadata) {
+        return Ok(Some(cached));
     }
     let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
     let envelope: CryptoEnvelope = match serde_json::from_str(raw.as_str()) {
@@ -3801,7 +3959,56 @@ fn read_db_file_by_name(
         Ok(value) => value,
         Err(_) => return Ok(None),
     };
-    Ok(Some(ensure_db_shape_value(parsed)))
+    let out = ensure_db_shape_value(parsed);
+    store_cached_source(filename, password, &metadata, &out);
+    Ok(Some(out))
+}
+
+fn source_cache() -> &'static Mutex<Option<SourceCacheEntry>> {
+    static CACHE: OnceLock<Mutex<Option<SourceCacheEntry>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(None))
+}
+
+fn load_cached_source(
+    filename: &str,
+    password: &str,
+    metadata: &fs::Metadata,
+) -> Option<serde_json::Value> {
+    let password_key = db_cache_key(password);
+    let modified = metadata.modified().ok();
+    let guard = source_cache().lock().ok()?;
+    let entry = guard.as_ref()?;
+    if entry.filename == filename
+        && entry.password_key == password_key
+        && entry.modified == modified
+        && entry.len == metadata.len()
+    {
+        return Some(entry.value.clone());
+    }
+    None
+}
+
+fn store_cached_source(
+    filename: &str,
+    password: &str,
+    metadata: &fs::Metadata,
+    value: &serde_json::Value,
+) {
+    if let Ok(mut guard) = source_cache().lock() {
+        *guard = Some(SourceCacheEntry {
+            filename: filename.to_string(),
+            password_key: db_cache_key(password),
+            modified: metadata.modified().ok(),
+            len: metadata.len(),
+            value: value.clone(),
+        });
+    }
+}
+
+fn clear_cached_source() {
+    if let Ok(mut guard) = source_cache().lock() {
+        *guard = None;
+    }
 }
 
 fn write_db_file_by_name(
@@ -3811,11 +4018,21 @@ fn write_db_file_by_name(
     password: &str,
 ) -> Result<(), String> {
     let path = imported_db_file_path(app, filename)?;
-    let normalized = ensure_db_shape_value(db.clone());
-    let text = serde_json::to_string(&normalized).map_err(|err| err.to_string())?;
-    let envelope = encrypt_text(text.as_str(), password)?;
-    let content = serde_json::to_string(&envelope).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())
+    let reshaped;
+    let normalized = if db_shape_is_valid(db) {
+        db
+    } else {
+        reshaped = ensure_db_shape_value(db.clone());
+        &reshaped
+    };
+    let plaintext = serde_json::to_vec(normalized).map_err(|err| err.to_string())?;
+    let envelope = encrypt_bytes(plaintext, password)?;
+    write_envelope_file(path.clone(), &envelope)?;
+    match fs::metadata(path.as_path()) {
+        Ok(metadata) => store_cached_source(filename, password, &metadata, normalized),
+        Err(_) => clear_cached_source(),
+    }
+    Ok(())
 }
 
 fn load_db_by_source_value(
@@ -3875,7 +4092,7 @@ fn store_imported_database(
 }
 
 fn merge_databases(target: &mut serde_json::Value, incoming: &serde_json::Value) {
-    *target = ensure_db_shape_value(target.clone());
+    *target = ensure_db_shape_value(std::mem::take(target));
     let incoming = ensure_db_shape_value(incoming.clone());
     let now = now_string();
 
@@ -4146,38 +4363,82 @@ fn default_pbkdf2_iterations() -> u32 {
     DEFAULT_PBKDF2_ITERATIONS
 }
 
+fn email_templates_file_path(app: &AppHandle) -> Result<PathBuf, String> {
+    Ok(storage_paths(app)?.email_templates.clone())
+}
+
 fn auth_file_path(app: &AppHandle) -> Result<PathBuf, String> {
-    let root = storage_root_dir(app)?;
-    Ok(root.join(AUTH_FILE))
+    Ok(storage_paths(app)?.auth.clone())
 }
 
-fn read_auth_record(app: &AppHandle) -> Result<Option<AuthRecord>, String> {
-    let path = auth_file_path(app)?;
-    if !path.exists() {
-        return Ok(None);
-    }
-    let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    let mut record: AuthRecord = match serde_json::from_str(raw.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(None),
-    };
+fn auth_cache() -> &'static Mutex<Option<AuthCacheEntry>> {
+    static CACHE: OnceLock<Mutex<Option<AuthCacheEntry>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(None))
+}
+
+fn parse_auth_record(raw: &[u8]) -> Option<AuthRecord> {
+    let mut record: AuthRecord = serde_json::from_slice(raw).ok()?;
     if record.salt.is_empty() || record.hash.is_empty() {
-        return Ok(None);
+        return None;
     }
     if record.iterations == 0 {
         record.iterations = DEFAULT_PBKDF2_ITERATIONS;
     }
-    Ok(Some(record))
+    Some(record)
+}
+
+fn auth_cache_lock() -> MutexGuard<'static, Option<AuthCacheEntry>> {
+    auth_cache()
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+fn read_auth_record(app: &AppHandle) -> Result<Option<AuthRecord>, String> {
+    let path = auth_file_path(app)?;
+    // Hold the cache lock for the whole read so a concurrent write cannot land
+    // between checking the file's metadata and reading its contents.
+    let mut cache = auth_cache_lock();
+    let mut file = match fs::File::open(path.as_path()) {
+        Ok(file) => file,
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => return Ok(None),
+        Err(err) => return Err(err.to_string()),
+    };
+    let metadata = file.metadata().map_err(|err| err.to_string())?;
+    if let Some(entry) = cache.as_ref() {
+        if entry.modified == metadata.modified().ok() && entry.len == metadata.len() {
+            return Ok(entry.record.clone());
+        }
+    }
+    let mut raw = Vec::with_capacity(metadata.len() as usize);
+    file.read_to_end(&mut raw).map_err(|err| err.to_string())?;
+    let record = parse_auth_record(raw.as_slice());
+    *cache = Some(AuthCacheEntry {
+        modified: metadata.modified().ok(),
+        len: metadata.len(),
+        record: record.clone(),
+    });
+    Ok(record)
 }
 
 fn write_auth_record(app: &AppHandle, payload: &AuthRecord) -> Result<(), String> {
     let path = auth_file_path(app)?;
     let content = serde_json::to_string_pretty(payload).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())
+    let mut cache = auth_cache_lock();
+    write_text_file(path.clone(), content.as_str())?;
+    // Cache the record just written so readers never fall back to a stale copy
+    // whose metadata happens to match on coarse-timestamp filesystems.
+    *cache = fs::metadata(path.as_path())
+        .ok()
+        .map(|metadata| AuthCacheEntry {
+            modified: metadata.modified().ok(),
+            len: metadata.len(),
+            record: parse_auth_record(content.as_bytes()),
+        });
+    Ok(())
 }
 
-fn encrypt_text_with_key(
-    text: &str,
+fn encrypt_bytes_with_key(
+    mut data: Vec<u8>,
     salt: &[u8],
     key: &[u8; 32],
 ) -> Result<CryptoEnvelope, String> {
@@ -4185,77 +4446,73 @@ fn encrypt_text_with_key(
     OsRng.fill_bytes(&mut iv);
     let cipher = Aes256Gcm::new_from_slice(key.as_slice()).map_err(|err| err.to_string())?;
     let nonce = Nonce::from_slice(&iv);
-    let encrypted = cipher
-        .encrypt(nonce, text.as_bytes())
+    let tag = cipher
+        .encrypt_in_place_detached(nonce, b"", &mut data)
         .map_err(|err| err.to_string())?;
 
-    if encrypted.len() < 16 {
-        return Err("Encryption output too short.".to_string());
-    }
-    let split_at = encrypted.len() - 16;
-    let (data, tag) = encrypted.split_at(split_at);
-
     Ok(CryptoEnvelope {
         v: 1,
         salt: encode_b64(salt),
         iv: encode_b64(&iv),
-        tag: encode_b64(tag),
-        data: encode_b64(data),
+        tag: encode_b64(tag.as_slice()),
+        data: encode_b64(&data),
     })
 }
 
-fn encrypt_text(text: &str, password: &str) -> Result<CryptoEnvelope, String> {
+fn encrypt_bytes(data: Vec<u8>, password: &str) -> Result<CryptoEnvelope, String> {
     let mut salt = [0u8; 16];
     OsRng.fill_bytes(&mut salt);
 
     let key = derive_key(password, &salt, DEFAULT_PBKDF2_ITERATIONS);
-    encrypt_text_with_key(text, &salt, &key)
+    encrypt_bytes_with_key(data, &salt, &key)
 }
 
-fn decrypt_envelope_with_key(
-    payload: &CryptoEnvelope,
-    key: &[u8; 32],
-) -> Result<Option<String>, String> {
-    let iv = match decode_b64(payload.iv.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(None),
-    };
-    let tag = match decode_b64(payload.tag.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(None),
-    };
-    let data = match decode_b64(payload.data.as_str()) {
-        Ok(value) => value,
-        Err(_) => return Ok(None),
-    };
-    if iv.len() != 12 || tag.is_empty() || data.is_empty() {
-        return Ok(None);
+struct DecodedEnvelope {
+    iv: Vec<u8>,
+    tag: Vec<u8>,
+    data: Vec<u8>,
+}
+
+// Validate the envelope shape before any caller pays for key derivation.
+fn decode_envelope(payload: &CryptoEnvelope) -> Option<DecodedEnvelope> {
+    let iv = decode_b64(payload.iv.as_str()).ok()?;
+    let tag = decode_b64(payload.tag.as_str()).ok()?;
+    let data = decode_b64(payload.data.as_str()).ok()?;
+    if iv.len() != 12 || tag.len() != 16 || data.is_empty() {
+        return None;
     }
+    Some(DecodedEnvelope { iv, tag, data })
+}
 
+fn open_envelope(decoded: DecodedEnvelope, key: &[u8; 32]) -> Result<Option<String>, String> {
+    let DecodedEnvelope { iv, tag, mut data } = decoded;
     let cipher = Aes256Gcm::new_from_slice(key.as_slice()).map_err(|err| err.to_string())?;
     let nonce = Nonce::from_slice(iv.as_slice());
-    let mut combined = Vec::with_capacity(data.len() + tag.len());
-    combined.extend_from_slice(data.as_slice());
-    combined.extend_from_slice(tag.as_slice());
+    let tag = Tag::from_slice(tag.as_slice());
 
-    let decrypted = match cipher.decrypt(nonce, combined.as_slice()) {
-        Ok(value) => value,
-        Err(_) => return Ok(None),
-    };
+    if cipher
+        .decrypt_in_place_detached(nonce, b"", &mut data, tag)
+        .is_err()
+    {
+        return Ok(None);
+    }
 
-    match String::from_utf8(decrypted) {
+    match String::from_utf8(data) {
         Ok(text) => Ok(Some(text)),
         Err(_) => Ok(None),
     }
 }
 
 fn decrypt_envelope(payload: &CryptoEnvelope, password: &str) -> Result<Option<String>, String> {
+    let Some(decoded) = decode_envelope(payload) else {
+        return Ok(None);
+    };
     let salt = match decode_b64(payload.salt.as_str()) {
         Ok(value) => value,
         Err(_) => return Ok(None),
     };
-    let key = derive_key(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS);
-    decrypt_envelope_with_key(payload, &key)
+    let key = derive_key_cached(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS);
+    open_envelope(decoded, &key)
 }
 
 fn db_cache() -> &'static Mutex<DbCacheState> {
@@ -4263,6 +4520,24 @@ fn db_cache() -> &'static Mutex<DbCacheState> {
     CACHE.get_or_init(|| Mutex::new(DbCacheState::default()))
 }
 
+// Serializes storage and settings file writes, which run on worker threads,
+// so two saves of the same file cannot race each other to disk.
+fn storage_write_lock() -> MutexGuard<'static, ()> {
+    static LOCK: OnceLock<Mutex<()>> = OnceLock::new();
+    LOCK.get_or_init(|| Mutex::new(()))
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
+// Serializes load-modify-save commands so writers on worker threads cannot
+// interleave and drop each other's changes.
+fn db_write_lock() -> MutexGuard<'static, ()> {
+    static LOCK: OnceLock<Mutex<()>> = OnceLock::new();
+    LOCK.get_or_init(|| Mutex::new(()))
+        .lock()
+        .unwrap_or_else(|poisoned| poisoned.into_inner())
+}
+
 fn db_cache_key(password: &str) -> String {
     let mut hasher = Sha256::new();
     hasher.update(password.as_bytes());
@@ -4279,6 +4554,16 @@ fn load_cached_db_value(password: &str) -> Option<serde_json::Value> {
     None
 }
 
+fn cached_db_value_matches(password: &str, value: &serde_json::Value) -> bool {
+    let cache_key = db_cache_key(password);
+    let Ok(guard) = db_cache().lock() else {
+        return false;
+    };
+    guard.key.as_deref() == Some(cache_key.as_str())
+        && guard.db_key.is_some()
+        && guard.value.as_ref() == Some(value)
+}
+
 fn store_cached_db_value(password: &str, value: &serde_json::Value) {
     if let Ok(mut guard) = db_cache().lock() {
         let cache_key = db_cache_key(password);
@@ -4291,6 +4576,24 @@ fn store_cached_db_value(password: &str, value: &serde_json::Value) {
     }
 }
 
+fn seed_cached_db_value(password: &str, value: serde_json::Value) -> serde_json::Value {
+    let Ok(mut guard) = db_cache().lock() else {
+        return value;
+    };
+    let cache_key = db_cache_key(password);
+    if guard.key.as_deref() == Some(cache_key.as_str()) {
+        if let Some(existing) = guard.value.as_ref() {
+            return existing.clone();
+        }
+    } else {
+        guard.db_salt = None;
+        guard.db_key = None;
+    }
+    guard.key = Some(cache_key);
+    guard.value = Some(value.clone());
+    value
+}
+
 fn load_cached_db_crypto(password: &str) -> Option<(Vec<u8>, [u8; 32])> {
     let cache_key = db_cache_key(password);
     let guard = db_cache().lock().ok()?;
@@ -4315,8 +4618,7 @@ fn store_cached_db_crypto(password: &str, salt: &[u8], key: [u8; 32]) {
 }
 
 fn db_file_path(app: &AppHandle) -> Result<PathBuf, String> {
-    let root = storage_root_dir(app)?;
-    Ok(root.join(DATA_FILE))
+    Ok(storage_paths(app)?.data.clone())
 }
 
 fn load_db_value(app: &AppHandle, password: &str) -> Result<serde_json::Value, String> {
@@ -4324,91 +4626,82 @@ fn load_db_value(app: &AppHandle, password: &str) -> Result<serde_json::Value, S
         return Ok(cached);
     }
     let path = db_file_path(app)?;
-    if !path.exists() {
-        let out = default_db_value();
-        store_cached_db_value(password, &out);
-        return Ok(out);
-    }
-    let raw = fs::read_to_string(path).map_err(|err| err.to_string())?;
-    let envelope: CryptoEnvelope = match serde_json::from_str(raw.as_str()) {
+    let Some(raw) = read_optional_file(path.as_path())? else {
+        return Ok(seed_cached_db_value(password, default_db_value()));
+    };
+    let envelope: CryptoEnvelope = match serde_json::from_slice(raw.as_slice()) {
         Ok(value) => value,
         Err(_) => {
-            let out = default_db_value();
-            store_cached_db_value(password, &out);
-            return Ok(out);
+            return Ok(seed_cached_db_value(password, default_db_value()));
         }
     };
     let salt = match decode_b64(envelope.salt.as_str()) {
         Ok(value) if !value.is_empty() => value,
         _ => {
-            let out = default_db_value();
-            store_cached_db_value(password, &out);
-            return Ok(out);
+            return Ok(seed_cached_db_value(password, default_db_value()));
         }
     };
+    let Some(decoded) = decode_envelope(&envelope) else {
+        return Ok(seed_cached_db_value(password, default_db_value()));
+    };
     let key = match load_cached_db_crypto(password) {
         Some((cached_salt, cached_key)) if cached_salt == salt => cached_key,
-        _ => derive_key(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS),
+        _ => derive_key_cached(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS),
     };
-    let decrypted = match decrypt_envelope_with_key(&envelope, &key)? {
+    let decrypted = match open_envelope(decoded, &key)? {
         Some(text) => text,
         None => {
-            let out = default_db_value();
-            store_cached_db_value(password, &out);
-            return Ok(out);
+            return Ok(seed_cached_db_value(password, default_db_value()));
         }
     };
     let parsed: serde_json::Value = match serde_json::from_str(decrypted.as_str()) {
         Ok(value) => value,
         Err(_) => {
-            let out = default_db_value();
-            store_cached_db_value(password, &out);
-            return Ok(out);
+            return Ok(seed_cached_db_value(password, default_db_value()));
         }
     };
-    let out = ensure_db_shape_value(parsed);
-    store_cached_db_value(password, &out);
+    let out = seed_cached_db_value(password, ensure_db_shape_value(parsed));
     store_cached_db_crypto(password, salt.as_slice(), key);
     Ok(out)
 }
 
 fn save_db_value(app: &AppHandle, password: &str, value: &serde_json::Value) -> Result<(), String> {
     let path = db_file_path(app)?;
-    let normalized = ensure_db_shape_value(value.clone());
-    let plaintext = serde_json::to_string(&normalized).map_err(|err| err.to_string())?;
+    let reshaped;
+    let normalized = if db_shape_is_valid(value) {
+        value
+    } else {
+        reshaped = ensure_db_shape_value(value.clone());
+        &reshaped
+    };
+    if cached_db_value_matches(password, normalized) && path.is_file() {
+        return Ok(());
+    }
+    let plaintext = serde_json::to_vec(normalized).map_err(|err| err.to_string())?;
     let (salt, key) = if let Some((salt, key)) = load_cached_db_crypto(password) {
         (salt, key)
-    } else if path.exists() {
-        let mut resolved: Option<(Vec<u8>, [u8; 32])> = None;
-        if let Ok(raw) = fs::read_to_string(path.as_path()) {
-            if let Ok(envelope) = serde_json::from_str::<CryptoEnvelope>(raw.as_str()) {
-                if let Ok(salt) = decode_b64(envelope.salt.as_str()) {
-                    if !salt.is_empty() {
-                        let key = derive_key(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS);
-                        resolved = Some((salt, key));
-                    }
-                }
+    } else {
+        let existing_salt = fs::read(path.as_path())
+            .ok()
+            .and_then(|raw| serde_json::from_slice::<CryptoEnvelope>(raw.as_slice()).ok())
+            .and_then(|envelope| decode_b64(envelope.salt.as_str()).ok())
+            .filter(|salt| !salt.is_empty());
+        match existing_salt {
+            Some(salt) => {
+                let key = derive_key_cached(password, salt.as_slice(), DEFAULT_PBKDF2_ITERATIONS);
+                (salt, key)
             }
-        }
-        match resolved {
-            Some(value) => value,
             None => {
                 let mut fresh_salt = [0u8; 16];
                 OsRng.fill_bytes(&mut fresh_salt);
-                let key = derive_key(password, &fresh_salt, DEFAULT_PBKDF2_ITERATIONS);
+                let key = derive_key_cached(password, &fresh_salt, DEFAULT_PBKDF2_ITERATIONS);
                 (fresh_salt.to_vec(), key)
             }
         }
-    } else {
-        let mut fresh_salt = [0u8; 16];
-        OsRng.fill_bytes(&mut fresh_salt);
-        let key = derive_key(password, &fresh_salt, DEFAULT_PBKDF2_ITERATIONS);
-        (fresh_salt.to_vec(), key)
     };
-    let envelope = encrypt_text_with_key(plaintext.as_str(), salt.as_slice(), &key)?;
-    let content = serde_json::to_string(&envelope).map_err(|err| err.to_string())?;
-    write_text_file(path, content.as_str())?;
-    store_cached_db_value(password, &normalized);
+    let envelope = encrypt_bytes_with_key(plaintext, salt.as_slice(), &key)?;
+    write_envelope_file(path, &envelope)?;
+    store_cached_db_value(password, normalized);
     store_cached_db_crypto(password, salt.as_slice(), key);
     Ok(())
 }
@@ -4431,7 +4724,32 @@ fn default_db_value() -> serde_json::Value {
     })
 }
 
+fn db_shape_is_valid(value: &serde_json::Value) -> bool {
+    let Some(obj) = value.as_object() else {
+        return false;
+    };
+    let Some(kanban) = obj.get("kanban").and_then(|v| v.as_object()) else {
+        return false;
+    };
+    let Some(recycle) = obj.get("recycle").and_then(|v| v.as_object()) else {
+        return false;
+    };
+    obj.get("version").is_some_and(|v| v.is_number())
+        && ["columns", "cards", "candidates"]
+            .iter()
+            .all(|key| kanban.get(*key).is_some_and(|v| v.is_array()))
+        && obj.get("uniforms").is_some_and(|v| v.is_array())
+        && obj.get("weekly").is_some_and(|v| v.is_object())
+        && obj.get("todos").is_some_and(|v| v.is_array())
+        && ["items", "redo"]
+            .iter()
+            .all(|key| recycle.get(*key).is_some_and(|v| v.is_array()))
+}
+
 fn ensure_db_shape_value(value: serde_json::Value) -> serde_json::Value {
+    if db_shape_is_valid(&value) {
+        return value;
+    }
     if !value.is_object() {
         return default_db_value();
     }
@@ -4728,14 +5046,13 @@ fn build_uniform_rows(db: &serde_json::Value) -> Vec<serde_json::Value> {
         })
         .collect();
 
-    rows.sort_by(|a, b| {
-        let abranch = row_string(a, "Branch");
-        let bbranch = row_string(b, "Branch");
-        abranch
-            .cmp(&bbranch)
-            .then(row_string(a, "Type").cmp(&row_string(b, "Type")))
-            .then(row_string(a, "Alteration").cmp(&row_string(b, "Alteration")))
-            .then(row_string(a, "Size").cmp(&row_string(b, "Size")))
+    rows.sort_by_cached_key(|row| {
+        (
+            row_string(row, "Branch"),
+            row_string(row, "Type"),
+            row_string(row, "Alteration"),
+            row_string(row, "Size"),
+        )
     });
     rows
 }
@@ -4763,11 +5080,7 @@ fn build_weekly_rows(db: &serde_json::Value) -> Vec<serde_json::Value> {
             }
         }
     }
-    rows.sort_by(|a, b| {
-        row_string(a, "week_start")
-            .cmp(&row_string(b, "week_start"))
-            .then(row_string(a, "day").cmp(&row_string(b, "day")))
-    });
+    rows.sort_by_cached_key(|row| (row_string(row, "week_start"), row_string(row, "day")));
     rows
 }
 
@@ -4856,49 +5169,102 @@ fn parse_nonnegative_integer(value: Option<&serde_json::Value>) -> i64 {
     parsed.unwrap_or(0).max(0)
 }
 
+fn read_optional_file(path: &Path) -> Result<Option<Vec<u8>>, String> {
+    match fs::read(path) {
+        Ok(bytes) => Ok(Some(bytes)),
+        Err(err) if err.kind() == std::io::ErrorKind::NotFound => Ok(None),
+        Err(err) => Err(err.to_string()),
+    }
+}
+
 fn write_text_file(path: PathBuf, content: &str) -> Result<(), String> {
+    write_file_atomic(path, |file| file.write_all(content.as_bytes()))
+}
+
+fn write_envelope_file(path: PathBuf, envelope: &CryptoEnvelope) -> Result<(), String> {
+    // Serialize straight into the temp file instead of building the JSON text first.
+    write_file_atomic(path, |file| {
+        let mut writer = std::io::BufWriter::new(file);
+        serde_json::to_writer(&mut writer, envelope)?;
+        writer.flush()
+    })
+}
+
+fn write_file_atomic(
+    path: PathBuf,
+    write: impl FnOnce(&mut fs::File) -> std::io::Result<()>,
+) -> Result<(), String> {
     if let Some(parent) = path.parent() {
         fs::create_dir_all(parent).map_err(|err| err.to_string())?;
     }
-    fs::write(path, content).map_err(|err| err.to_string())?;
+    // Give each write its own temp file so concurrent writes to one path cannot interleave.
+    static TMP_COUNTER: AtomicU64 = AtomicU64::new(0);
+    let seq = TMP_COUNTER.fetch_add(1, Ordering::Relaxed);
+    let mut tmp_name = path.file_name().unwrap_or_default().to_os_string();
+    tmp_name.push(format!(".{}.{seq}.tmp", std::process::id()));
+    let tmp_path = path.with_file_name(tmp_name);
+    let written = fs::File::create(tmp_path.as_path()).and_then(|mut file| {
+        write(&mut file)?;
+        file.sync_all()
+    });
+    if let Err(err) = written.and_then(|_| fs::rename(tmp_path.as_path(), path.as_path())) {
+        let _ = fs::remove_file(tmp_path.as_path());
+        return Err(err.to_string());
+    }
     Ok(())
 }
 
+fn write_text_file_if_changed(path: PathBuf, content: &str) -> Result<(), String> {
+    // Skip the temp write, fsync and rename when the file already holds this content.
+    let same_len = fs::metadata(path.as_path())
+        .map(|meta| meta.len() == content.len() as u64)
+        .unwrap_or(false);
+    if same_len && fs::read(path.as_path()).is_ok_and(|existing| existing == content.as_bytes()) {
+        return Ok(());
+    }
+    write_text_file(path, content)
+}
+
 fn path_has_storage_data(root: &Path) -> bool {
     storage_root_score(root) > 0
 }
 
 fn storage_root_score(root: &Path) -> i64 {
-    if !root.exists() {
-        return -1;
-    }
+    let entries = match fs::read_dir(root) {
+        Ok(entries) => entries,
+        Err(_) if !root.exists() => return -1,
+        Err(_) => return 0,
+    };
 
     let mut score = 0_i64;
-    let data_path = root.join(DATA_FILE);
-    if data_path.is_file() {
-        score += 50;
-        if let Ok(meta) = fs::metadata(data_path) {
-            // Prefer roots that appear to contain real historical data.
-            score += ((meta.len() / 1024) as i64).min(10_000);
-        }
-    }
-    if root.join(AUTH_FILE).is_file() {
-        score += 10;
-    }
-    if root.join(META_FILE).is_file() {
-        score += 20;
-    }
-    if root.join(EMAIL_TEMPLATES_FILE).is_file() {
-        score += 5;
-    }
-
-    let dbs = root.join("dbs");
-    if dbs.is_dir() {
-        if let Ok(entries) = fs::read_dir(dbs) {
-            let entry_count = entries.filter(|entry| entry.is_ok()).take(200).count() as i64;
-            if entry_count > 0 {
-                score += 100 + entry_count;
+    for entry in entries.flatten() {
+        let Ok(file_type) = entry.file_type() else {
+            continue;
+        };
+        let path = entry.path();
+        let is_file = file_type.is_file() || (file_type.is_symlink() && path.is_file());
+        let is_dir = file_type.is_dir() || (file_type.is_symlink() && path.is_dir());
+        match entry.file_name().to_str() {
+            Some(DATA_FILE) if is_file => {
+                score += 50;
+                if let Ok(meta) = fs::metadata(path) {
+                    // Prefer roots that appear to contain real historical data.
+                    score += ((meta.len() / 1024) as i64).min(10_000);
+                }
             }
+            Some(AUTH_FILE) if is_file => score += 10,
+            Some(META_FILE) if is_file => score += 20,
+            Some(EMAIL_TEMPLATES_FILE) if is_file => score += 5,
+            Some("dbs") if is_dir => {
+                if let Ok(db_entries) = fs::read_dir(path) {
+                    let entry_count =
+                        db_entries.filter(|entry| entry.is_ok()).take(200).count() as i64;
+                    if entry_count > 0 {
+                        score += 100 + entry_count;
+                    }
+                }
+            }
+            _ => {}
         }
     }
 
@@ -4941,10 +5307,10 @@ fn legacy_storage_roots(app: &AppHandle) -> Vec<PathBuf> {
     roots
 }
 
-fn storage_root_dir(app: &AppHandle) -> Result<PathBuf, String> {
-    static RESOLVED_ROOT: OnceLock<PathBuf> = OnceLock::new();
-    if let Some(root) = RESOLVED_ROOT.get() {
-        return Ok(root.clone());
+fn storage_paths(app: &AppHandle) -> Result<&'static StoragePaths, String> {
+    static RESOLVED_PATHS: OnceLock<StoragePaths> = OnceLock::new();
+    if let Some(paths) = RESOLVED_PATHS.get() {
+        return Ok(paths);
     }
 
     let base = app.path().app_data_dir().map_err(|err| err.to_string())?;
@@ -4965,8 +5331,17 @@ fn storage_root_dir(app: &AppHandle) -> Result<PathBuf, String> {
     }
 
     fs::create_dir_all(resolved.as_path()).map_err(|err| err.to_string())?;
-    let _ = RESOLVED_ROOT.set(resolved.clone());
-    Ok(resolved)
+    Ok(RESOLVED_PATHS.get_or_init(|| StoragePaths {
+        auth: resolved.join(AUTH_FILE),
+        data: resolved.join(DATA_FILE),
+        meta: resolved.join(META_FILE),
+        email_templates: resolved.join(EMAIL_TEMPLATES_FILE),
+        root: resolved,
+    }))
+}
+
+fn storage_root_dir(app: &AppHandle) -> Result<PathBuf, String> {
+    Ok(storage_paths(app)?.root.clone())
 }
 
 fn sanitize_relative_path(value: &str) -> Result<PathBuf, String> {
@@ -4984,15 +5359,15 @@ fn sanitize_relative_path(value: &str) -> Result<PathBuf, String> {
     Ok(out)
 }
 
+fn is_safe_filename_char(ch: char) -> bool {
+    ch.is_ascii_alphanumeric() || matches!(ch, '-' | '_' | '.')
+}
+
 fn sanitize_filename(value: &str) -> String {
-    let mut out = String::new();
-    for ch in value.chars() {
-        if ch.is_ascii_alphanumeric() || ch == '-' || ch == '_' || ch == '.' {
-            out.push(ch);
-        } else {
-            out.push('_');
-        }
-    }
+    let out: String = value
+        .chars()
+        .map(|ch| if is_safe_filename_char(ch) { ch } else { '_' })
+        .collect();
     let trimmed = out.trim_matches('_');
     if trimmed.is_empty() {
         "workflow-export.csv".to_string()
@@ -5004,7 +5379,10 @@ fn sanitize_filename(value: &str) -> String {
 fn sanitize_export_filename(value: &str) -> String {
     let trimmed = clamp_string(value, 255, true);
     let safe = sanitize_filename(trimmed.as_str());
-    if safe.to_lowercase().ends_with(".csv") {
+    let has_csv_suffix = safe
+        .get(safe.len().saturating_sub(4)..)
+        .is_some_and(|suffix| suffix.eq_ignore_ascii_case(".csv"));
+    if has_csv_suffix {
         safe
     } else {
         format!("{safe}.csv")
@@ -5033,20 +5411,25 @@ fn should_neutralize_csv(value: &str) -> bool {
     )
 }
 
-fn neutralize_csv_formula(value: &str) -> String {
-    if should_neutralize_csv(value) {
-        format!("'{value}")
+fn push_csv_field(out: &mut String, value: &str) {
+    let prefix = if should_neutralize_csv(value) {
+        "'"
     } else {
-        value.to_string()
-    }
-}
-
-fn csv_escape(value: &str) -> String {
-    let safe = neutralize_csv_formula(value);
-    if safe.contains(',') || safe.contains('"') || safe.contains('\n') || safe.contains('\r') {
-        format!("\"{}\"", safe.replace('"', "\"\""))
+        ""
+    };
+    if value.contains([',', '"', '\n', '\r']) {
+        out.push('"');
+        out.push_str(prefix);
+        for ch in value.chars() {
+            if ch == '"' {
+                out.push('"');
+            }
+            out.push(ch);
+        }
+        out.push('"');
     } else {
-        safe
+        out.push_str(prefix);
+        out.push_str(value);
     }
 }
 
@@ -5066,28 +5449,33 @@ fn js_like_value_string(value: Option<&serde_json::Value>) -> String {
 }
 
 fn rows_to_csv(columns: &[String], rows: &[serde_json::Value]) -> String {
-    let mut lines: Vec<String> = Vec::new();
-    if !columns.is_empty() {
-        lines.push(
-            columns
-                .iter()
-                .map(|col| csv_escape(col.as_str()))
-                .collect::<Vec<_>>()
-                .join(","),
-        );
+    let mut out = String::with_capacity((rows.len() + 1) * columns.len() * 16);
+    for (idx, column) in columns.iter().enumerate() {
+        if idx > 0 {
+            out.push(',');
+        }
+        push_csv_field(&mut out, column.as_str());
     }
-    for row in rows {
-        let line = columns
-            .iter()
-            .map(|column| {
-                let value = row.as_object().and_then(|obj| obj.get(column));
-                csv_escape(js_like_value_string(value).as_str())
-            })
-            .collect::<Vec<_>>()
-            .join(",");
-        lines.push(line);
+    for (row_idx, row) in rows.iter().enumerate() {
+        if row_idx > 0 || !columns.is_empty() {
+            out.push('\n');
+        }
+        let obj = row.as_object();
+        for (idx, column) in columns.iter().enumerate() {
+            if idx > 0 {
+                out.push(',');
+            }
+            match obj.and_then(|obj| obj.get(column)) {
+                Some(serde_json::Value::String(text)) => push_csv_field(&mut out, text.as_str()),
+                Some(serde_json::Value::Bool(flag)) => {
+                    out.push_str(if *flag { "true" } else { "false" });
+                }
+                Some(serde_json::Value::Null) | None => {}
+                value => push_csv_field(&mut out, js_like_value_string(value).as_str()),
+            }
+        }
     }
-    lines.join("\n")
+    out
 }
 
 fn derive_key(password: &str, salt: &[u8], iterations: u32) -> [u8; 32] {
@@ -5096,6 +5484,39 @@ fn derive_key(password: &str, salt: &[u8], iterations: u32) -> [u8; 32] {
     key
 }
 
+fn kdf_cache() -> &'static Mutex<Vec<KdfCacheEntry>> {
+    static CACHE: OnceLock<Mutex<Vec<KdfCacheEntry>>> = OnceLock::new();
+    CACHE.get_or_init(|| Mutex::new(Vec::with_capacity(KDF_CACHE_LIMIT)))
+}
+
+// Unlock and import re-derive against the same salts; skip repeating the PBKDF2 work.
+fn derive_key_cached(password: &str, salt: &[u8], iterations: u32) -> [u8; 32] {
+    let mut password_digest = [0u8; 32];
+    password_digest.copy_from_slice(Sha256::digest(password.as_bytes()).as_slice());
+    if let Ok(guard) = kdf_cache().lock() {
+        if let Some(entry) = guard.iter().find(|entry| {
+            entry.iterations == iterations
+                && entry.salt.as_slice() == salt
+                && entry.password_digest == password_digest
+        }) {
+            return entry.key;
+        }
+    }
+    let key = derive_key(password, salt, iterations);
+    if let Ok(mut guard) = kdf_cache().lock() {
+        if guard.len() >= KDF_CACHE_LIMIT {
+            guard.remove(0);
+        }
+        guard.push(KdfCacheEntry {
+            password_digest,
+            salt: salt.to_vec(),
+            iterations,
+            key,
+        });
+    }
+    key
+}
+
 fn decode_b64(value: &str) -> Result<Vec<u8>, String> {
     B64.decode(value).map_err(|err| err.to_string())
 }
@@ -5164,6 +5585,7 @@ fn main() {
             db_kanban_process_candidate,
             db_kanban_remove_candidate,
             db_kanban_reorder_column,
+            db_kanban_move_card,
             db_uniforms_add_item,
             db_delete_rows,
             db_validate_current,
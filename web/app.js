@@ -96,12 +96,11 @@ import {
     return isScrollable(pageBody) ? pageBody : null;
   };
 
-  const bindTopbarAutoHide = () => {
+  const bindTopbarAutoHide = (page = document.querySelector(".page--active")) => {
     if (topbarScrollCleanup) {
       topbarScrollCleanup();
       topbarScrollCleanup = null;
     }
-    const page = document.querySelector(".page--active");
     if (!page) return;
     const topbar = page.querySelector(".topbar");
     if (!topbar) return;
@@ -153,17 +152,23 @@ import {
     cache: new Map(),
     activeManualId: "user-manual",
     headings: [],
+    headingEls: [],
+    headingOffsets: null,
+    layoutObserver: null,
+    activeHeadingId: "",
     appVersion: null,
     appVersionLoading: null,
   };
 
-  const escapeHtml = (value) =>
-    String(value || "")
-      .replace(/&/g, "&amp;")
-      .replace(/</g, "&lt;")
-      .replace(/>/g, "&gt;")
-      .replace(/"/g, "&quot;")
-      .replace(/'/g, "&#39;");
+  const HTML_ESCAPES = {
+    "&": "&amp;",
+    "<": "&lt;",
+    ">": "&gt;",
+    '"': "&quot;",
+    "'": "&#39;",
+  };
+
+  const escapeHtml = (value) => String(value || "").replace(/[&<>"']/g, (ch) => HTML_ESCAPES[ch]);
 
   const toHeadingSlug = (value, used = new Set()) => {
     const base =
@@ -336,10 +341,14 @@ import {
 
   const clearHelpHighlights = (container) => {
     if (!container) return;
-    container.querySelectorAll("mark.manual-highlight").forEach((mark) => {
+    const marks = container.querySelectorAll("mark.manual-highlight");
+    if (!marks.length) return;
+    const parents = new Set();
+    marks.forEach((mark) => {
+      parents.add(mark.parentNode);
       mark.replaceWith(document.createTextNode(mark.textContent || ""));
     });
-    container.normalize();
+    parents.forEach((parent) => parent.normalize());
   };
 
   const highlightHelpMatches = (container, rawQuery) => {
@@ -359,7 +368,6 @@ import {
           if (!node.nodeValue || !node.nodeValue.trim()) return NodeFilter.FILTER_REJECT;
           const parent = node.parentElement;
           if (!parent) return NodeFilter.FILTER_REJECT;
-          if (parent.closest("mark.manual-highlight")) return NodeFilter.FILTER_REJECT;
           if (parent.closest("pre, code")) return NodeFilter.FILTER_REJECT;
           return NodeFilter.FILTER_ACCEPT;
         },
@@ -407,23 +415,58 @@ import {
     return { count, firstMatch };
   };
 
+  const getHelpHeadingOffset = (content, headingEl, contentTop) =>
+    headingEl.getBoundingClientRect().top - contentTop + content.scrollTop;
+
+  // Drop the cached heading offsets whenever the manual's blocks change size, e.g. on a
+  // resize, font-size or compact-mode change, or when a late image finishes loading.
+  const observeHelpContentLayout = (content) => {
+    if (!helpState.layoutObserver) {
+      helpState.layoutObserver = new ResizeObserver(() => {
+        helpState.headingOffsets = null;
+      });
+    }
+    const observer = helpState.layoutObserver;
+    observer.disconnect();
+    observer.observe(content);
+    Array.from(content.children).forEach((child) => observer.observe(child));
+  };
+
   const updateHelpTocActive = () => {
     const content = $("help-manual-content");
     const tocList = $("help-manual-toc-list");
     if (!content || !tocList || !helpState.headings.length) return;
 
+    if (!helpState.headingOffsets) {
+      const contentTop = content.getBoundingClientRect().top;
+      helpState.headingOffsets = helpState.headingEls.map((headingEl) =>
+        getHelpHeadingOffset(content, headingEl, contentTop),
+      );
+    }
+
     const top = content.scrollTop + 10;
-    let activeId = helpState.headings[0].id;
-    helpState.headings.forEach((heading) => {
-      const headingEl = content.querySelector(`#${heading.id}`);
-      if (headingEl && headingEl.offsetTop <= top) {
-        activeId = heading.id;
+    const offsets = helpState.headingOffsets;
+    let low = 0;
+    let high = offsets.length - 1;
+    let activeIndex = -1;
+    while (low <= high) {
+      const mid = (low + high) >> 1;
+      if (offsets[mid] <= top) {
+        activeIndex = mid;
+        low = mid + 1;
+      } else {
+        high = mid - 1;
       }
-    });
+    }
+    const activeId =
+      activeIndex >= 0 ? helpState.headingEls[activeIndex].id : helpState.headings[0].id;
+    if (activeId === helpState.activeHeadingId) return;
 
-    tocList.querySelectorAll(".help-manual-toc__item").forEach((item) => {
-      item.classList.toggle("help-manual-toc__item--active", item.dataset.headingId === activeId);
-    });
+    const previous = tocList.querySelector(".help-manual-toc__item--active");
+    if (previous) previous.classList.remove("help-manual-toc__item--active");
+    const next = tocList.querySelector(`[data-heading-id="${activeId}"]`);
+    if (next) next.classList.add("help-manual-toc__item--active");
+    helpState.activeHeadingId = activeId;
   };
 
   const renderHelpManualToc = (headings) => {
@@ -436,6 +479,7 @@ import {
       return;
     }
 
+    const fragment = document.createDocumentFragment();
     headings.forEach((heading) => {
       const button = document.createElement("button");
       button.type = "button";
@@ -443,15 +487,17 @@ import {
       button.textContent = heading.text;
       button.dataset.headingId = heading.id;
       button.addEventListener("click", () => {
-        const target = content.querySelector(`#${heading.id}`);
+        const target = helpState.headingEls.find((el) => el.id === heading.id);
         if (!target) return;
-        content.scrollTo({ top: Math.max(0, target.offsetTop - 8), behavior: "smooth" });
+        const offset = getHelpHeadingOffset(content, target, content.getBoundingClientRect().top);
+        content.scrollTo({ top: Math.max(0, offset - 8), behavior: "smooth" });
       });
-      tocList.appendChild(button);
+      fragment.appendChild(button);
     });
+    tocList.appendChild(fragment);
   };
 
-  const loadHelpManualMarkdown = async (manualId) => {
+  const loadHelpManual = async (manualId) => {
     const manual = getHelpManualById(manualId);
     if (helpState.cache.has(manual.id)) {
       return helpState.cache.get(manual.id);
@@ -470,8 +516,9 @@ import {
       throw new Error(`Unable to load manual: ${manual.label}`);
     }
 
-    helpState.cache.set(manual.id, text);
-    return text;
+    const parsed = parseMarkdownManual(text);
+    helpState.cache.set(manual.id, parsed);
+    return parsed;
   };
 
   const resolveAppVersionLabel = async () => {
@@ -547,32 +594,40 @@ import {
     helpState.activeManualId = manual.id;
     if (select) select.value = manual.id;
 
+    let parsed = null;
     try {
-      const markdown = await loadHelpManualMarkdown(manual.id);
-      const parsed = parseMarkdownManual(markdown);
-      const headings = parsed.headings.length
-        ? parsed.headings
-        : [{ id: "manual-top", text: manual.label, level: 1 }];
-      const contentHtml = parsed.headings.length
-        ? parsed.html
-        : `<h1 id="manual-top">${escapeHtml(manual.label)}</h1>\n${parsed.html}`;
-      title.textContent = manual.label;
-      content.innerHTML = contentHtml || "<p class='muted'>This manual is empty.</p>";
-      helpState.headings = headings;
-      renderHelpManualToc(headings);
-      modal.classList.remove("hidden");
-      content.scrollTop = 0;
-      clearHelpHighlights(content);
-      if (searchInput) searchInput.value = "";
-      if (searchResult) searchResult.textContent = "Type to search.";
-      updateHelpTocActive();
-      if (searchInput) searchInput.focus();
+      parsed = await loadHelpManual(manual.id);
     } catch (error) {
       await showMessageModal(
         "Manual Unavailable",
         `Unable to load ${manual.label}. Please verify the manual files are present.`,
       );
+      return;
     }
+
+    const headings = parsed.headings.length
+      ? parsed.headings
+      : [{ id: "manual-top", text: manual.label, level: 1 }];
+    const contentHtml = parsed.headings.length
+      ? parsed.html
+      : `<h1 id="manual-top">${escapeHtml(manual.label)}</h1>\n${parsed.html}`;
+    title.textContent = manual.label;
+    content.innerHTML = contentHtml || "<p class='muted'>This manual is empty.</p>";
+    helpState.headings = headings;
+    helpState.headingEls = headings
+      .map((heading) => content.querySelector(`#${heading.id}`))
+      .filter(Boolean);
+    helpState.headingOffsets = null;
+    helpState.activeHeadingId = "";
+    observeHelpContentLayout(content);
+    renderHelpManualToc(headings);
+    modal.classList.remove("hidden");
+    content.scrollTop = 0;
+    clearHelpHighlights(content);
+    if (searchInput) searchInput.value = "";
+    if (searchResult) searchResult.textContent = "Type to search.";
+    updateHelpTocActive();
+    if (searchInput) searchInput.focus();
   };
 
   const closeHelpManualModal = () => {
@@ -580,6 +635,7 @@ import {
     const content = $("help-manual-content");
     if (modal) modal.classList.add("hidden");
     if (content) clearHelpHighlights(content);
+    if (helpState.layoutObserver) helpState.layoutObserver.disconnect();
   };
 
   const pushUndo = (undoId, { clearRedo = true } = {}) => {
@@ -672,8 +728,10 @@ import {
     if (!state.kanban.cache.dirty && state.kanban.cache.columns) return;
     const sortedColumns = [...state.kanban.columns].sort(sortByOrder);
     const cardsByColumn = new Map();
+    const cardsById = new Map();
     state.kanban.cards.forEach((card) => {
       if (!card) return;
+      cardsById.set(card.uuid, card);
       const list = cardsByColumn.get(card.column_id) || [];
       list.push(card);
       cardsByColumn.set(card.column_id, list);
@@ -683,6 +741,7 @@ import {
     });
     state.kanban.cache.columns = sortedColumns;
     state.kanban.cache.cardsByColumn = cardsByColumn;
+    state.kanban.cache.cardsById = cardsById;
     state.kanban.cache.dirty = false;
   };
 
@@ -696,6 +755,11 @@ import {
     return state.kanban.cache.cardsByColumn.get(columnId) || [];
   };
 
+  const getKanbanCard = (cardId) => {
+    ensureKanbanCache();
+    return state.kanban.cache.cardsById.get(cardId) || null;
+  };
+
   let authModalAwaitingResolution = false;
   let authReauthOnFocusRequired = false;
   let authReauthInProgress = false;
@@ -736,13 +800,7 @@ import {
     setAuthInlineError("");
     const passwordInput = $("auth-password");
     if (passwordInput) {
-      window.setTimeout(() => {
-        try {
-          passwordInput.focus();
-        } catch (_err) {
-          // Ignore focus errors.
-        }
-      }, 0);
+      window.setTimeout(() => passwordInput.focus(), 0);
     }
     modal.classList.remove("hidden");
     await refreshBiometricAuthButton();
@@ -1173,83 +1231,88 @@ import {
     });
   };
 
-  const renderKanbanCard = (cardData) => {
+  let kanbanCardTemplate = null;
+
+  const getKanbanCardTemplate = () => {
+    if (kanbanCardTemplate) return kanbanCardTemplate;
     const card = document.createElement("div");
     card.className = "kanban-card";
     card.draggable = true;
-    card.dataset.cardId = cardData.uuid;
 
     const header = document.createElement("div");
     header.className = "kanban-card__header";
-
     const title = document.createElement("div");
     title.className = "kanban-card__title";
-    title.textContent = cardData.candidate_name || "Unnamed Candidate";
     header.append(title);
 
+    const createLabeledSpan = (labelText) => {
+      const span = document.createElement("span");
+      const label = document.createElement("span");
+      label.className = "kanban-card__label";
+      label.textContent = labelText;
+      span.append(label, document.createTextNode(""));
+      return span;
+    };
+
     const meta = document.createElement("div");
     meta.className = "kanban-card__meta";
-
     const row = document.createElement("div");
     row.className = "kanban-card__row";
-    const icims = document.createElement("span");
-    const icimsLabel = document.createElement("span");
-    icimsLabel.className = "kanban-card__label";
-    icimsLabel.textContent = "ICIMS:";
-    icims.append(icimsLabel, document.createTextNode(` ${cardData.icims_id || "—"}`));
-    row.appendChild(icims);
-    if (cardData.employee_id) {
-      const emp = document.createElement("span");
-      const empLabel = document.createElement("span");
-      empLabel.className = "kanban-card__label";
-      empLabel.textContent = "Employee:";
-      emp.append(empLabel, document.createTextNode(` ${cardData.employee_id}`));
-      row.appendChild(emp);
-    }
-
+    row.append(createLabeledSpan("ICIMS:"), createLabeledSpan("Employee:"));
     const jobRow = document.createElement("div");
     jobRow.className = "kanban-card__row";
-    const jobText = [cardData.job_id, cardData.job_name].filter(Boolean).join(" · ");
-    const jobSpan = document.createElement("span");
-    const jobLabel = document.createElement("span");
-    jobLabel.className = "kanban-card__label";
-    jobLabel.textContent = "Job:";
-    jobSpan.append(jobLabel, document.createTextNode(` ${jobText || "—"}`));
-    const managerSpan = document.createElement("span");
-    const managerLabel = document.createElement("span");
-    managerLabel.className = "kanban-card__label";
-    managerLabel.textContent = "Manager:";
-    managerSpan.append(managerLabel, document.createTextNode(` ${cardData.manager || "—"}`));
-    jobRow.append(jobSpan, managerSpan);
+    jobRow.append(createLabeledSpan("Job:"), createLabeledSpan("Manager:"));
+    meta.append(row, jobRow);
 
     const uuid = document.createElement("div");
     uuid.className = "kanban-card__uuid";
-    uuid.textContent = cardData.uuid || "";
 
-    meta.append(row, jobRow);
     card.append(header, meta, uuid);
+    kanbanCardTemplate = card;
+    return kanbanCardTemplate;
+  };
 
-    card.addEventListener("dragstart", (event) => {
-      state.kanban.draggingCardId = cardData.uuid;
-      card.classList.add("dragging");
-      event.dataTransfer.setData("text/plain", cardData.uuid);
-      event.dataTransfer.effectAllowed = "move";
-    });
+  const kanbanCardElements = new WeakMap();
 
-    card.addEventListener("dragend", () => {
-      state.kanban.draggingCardId = null;
-      card.classList.remove("dragging");
-    });
+  const getKanbanCardSignature = (cardData) =>
+    [
+      cardData.uuid,
+      cardData.candidate_name,
+      cardData.icims_id,
+      cardData.employee_id,
+      cardData.job_id,
+      cardData.job_name,
+      cardData.manager,
+    ].join("\u001f");
 
-    card.addEventListener("click", () => {
-      if (state.kanban.draggingCardId) return;
-      openDetailsDrawer(cardData);
-    });
-    card.addEventListener("dblclick", () => {
-      if (state.kanban.draggingCardId) return;
-      openCandidateModal("edit", cardData.column_id, cardData);
-    });
+  const renderKanbanCard = (cardData) => {
+    const signature = getKanbanCardSignature(cardData);
+    const cached = kanbanCardElements.get(cardData);
+    if (cached && cached.signature === signature) return cached.element;
+
+    const card = getKanbanCardTemplate().cloneNode(true);
+    card.dataset.cardId = cardData.uuid;
+
+    const [header, meta, uuid] = card.children;
+    header.firstChild.textContent = cardData.candidate_name || "Unnamed Candidate";
+
+    const [row, jobRow] = meta.children;
+    const [icims, emp] = row.children;
+    icims.lastChild.data = ` ${cardData.icims_id || "—"}`;
+    if (cardData.employee_id) {
+      emp.lastChild.data = ` ${cardData.employee_id}`;
+    } else {
+      emp.remove();
+    }
+
+    const [jobSpan, managerSpan] = jobRow.children;
+    const jobText = [cardData.job_id, cardData.job_name].filter(Boolean).join(" · ");
+    jobSpan.lastChild.data = ` ${jobText || "—"}`;
+    managerSpan.lastChild.data = ` ${cardData.manager || "—"}`;
+
+    uuid.textContent = cardData.uuid || "";
 
+    kanbanCardElements.set(cardData, { signature, element: card });
     return card;
   };
 
@@ -1262,18 +1325,18 @@ import {
     titleEl.className = "details-card__title";
     titleEl.textContent = title;
     card.appendChild(titleEl);
+    const list = document.createElement("div");
+    list.className = "details-card__items";
     filtered.forEach((item) => {
-      const row = document.createElement("div");
-      row.className = "details-item";
       const label = document.createElement("div");
       label.className = "details-item__label";
       label.textContent = item.label;
       const value = document.createElement("div");
       value.className = "details-item__value";
       value.textContent = normalizeValue(item.value);
-      row.append(label, value);
-      card.appendChild(row);
+      list.append(label, value);
     });
+    card.appendChild(list);
     return card;
   };
 
@@ -1285,7 +1348,7 @@ import {
     if (!drawer || !body || !title || !scheduled) return;
 
     const cardId = state.kanban.detailsCardId;
-    const card = state.kanban.cards.find((item) => item.uuid === cardId);
+    const card = getKanbanCard(cardId);
     if (!card) {
       closeDetailsDrawer();
       return;
@@ -1443,7 +1506,7 @@ import {
   const getDetailsSelectedCard = () => {
     const cardId = state.kanban.detailsCardId;
     if (!cardId) return null;
-    return state.kanban.cards.find((item) => item.uuid === cardId) || null;
+    return getKanbanCard(cardId);
   };
 
   const openDetailsBasicInfo = () => {
@@ -1470,7 +1533,7 @@ import {
     const arrival = $("process-arrival");
     const departure = $("process-departure");
     const branch = $("process-branch");
-    const card = state.kanban.cards.find((item) => item.uuid === state.kanban.detailsCardId);
+    const card = getKanbanCard(state.kanban.detailsCardId);
     const row = state.kanban.detailsRow || {};
     if (!modal) return;
     if (arrival) arrival.value = "";
@@ -1616,16 +1679,14 @@ import {
         state.kanban.columns = previousColumns;
         state.kanban.cards = previousCards;
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
       },
       request: () => workflowApi.kanbanRemoveCandidate(candidateId),
       onSuccess: (payload) => {
         if (payload && payload.columns) state.kanban.columns = payload.columns;
         if (payload && payload.cards) state.kanban.cards = payload.cards;
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
         if (payload && payload.undoId) {
           pushUndo(payload.undoId);
           showToast({
@@ -1668,22 +1729,32 @@ import {
     const body = document.createElement("div");
     body.className = "kanban__column-body";
     body.dataset.columnId = column.id;
-    body.addEventListener("dragover", (event) => {
+    let dragFrame = 0;
+    let dragClientY = 0;
+    const placeDraggingCard = () => {
       if (!state.kanban.draggingCardId) return;
-      event.preventDefault();
-      body.classList.add("is-over");
-      event.dataTransfer.dropEffect = "move";
-      const afterElement = getDragAfterElement(body, event.clientY);
       const draggingEl = document.querySelector(
         `.kanban-card[data-card-id="${state.kanban.draggingCardId}"]`,
       );
-      if (draggingEl) {
-        if (afterElement == null) {
-          body.appendChild(draggingEl);
-        } else {
-          body.insertBefore(draggingEl, afterElement);
-        }
+      if (!draggingEl) return;
+      const afterElement = getDragAfterElement(body, dragClientY);
+      if (afterElement == null) {
+        if (body.lastElementChild !== draggingEl) body.appendChild(draggingEl);
+      } else if (draggingEl.nextElementSibling !== afterElement) {
+        body.insertBefore(draggingEl, afterElement);
       }
+    };
+    body.addEventListener("dragover", (event) => {
+      if (!state.kanban.draggingCardId) return;
+      event.preventDefault();
+      body.classList.add("is-over");
+      event.dataTransfer.dropEffect = "move";
+      dragClientY = event.clientY;
+      if (dragFrame) return;
+      dragFrame = requestAnimationFrame(() => {
+        dragFrame = 0;
+        placeDraggingCard();
+      });
     });
     body.addEventListener("dragleave", () => {
       body.classList.remove("is-over");
@@ -1691,8 +1762,15 @@ import {
     body.addEventListener("drop", async (event) => {
       event.preventDefault();
       body.classList.remove("is-over");
+      if (dragFrame) {
+        cancelAnimationFrame(dragFrame);
+        dragFrame = 0;
+        dragClientY = event.clientY;
+        placeDraggingCard();
+      }
       const cardId = event.dataTransfer.getData("text/plain");
       if (!cardId) return;
+      flushKanbanColumnRender(body);
       const orderedIds = Array.from(body.querySelectorAll(".kanban-card")).map(
         (el) => el.dataset.cardId,
       );
@@ -1703,16 +1781,73 @@ import {
     return columnEl;
   };
 
+  const KANBAN_RENDER_BATCH = 100;
+  const pendingKanbanColumnRenders = new WeakMap();
+
+  const scheduleIdle = (callback) =>
+    window.requestIdleCallback
+      ? window.requestIdleCallback(callback)
+      : window.setTimeout(callback, 0);
+
+  const cancelIdle = (handle) => {
+    if (window.cancelIdleCallback) {
+      window.cancelIdleCallback(handle);
+    } else {
+      window.clearTimeout(handle);
+    }
+  };
+
+  const flushKanbanColumnRender = (body) => {
+    const pending = pendingKanbanColumnRenders.get(body);
+    if (pending) pending.flush();
+  };
+
   const renderKanbanColumnCards = (columnEl, columnId) => {
     if (!columnEl) return;
     const body = columnEl.querySelector(".kanban__column-body");
     if (!body) return;
-    const fragment = document.createDocumentFragment();
+    const previous = pendingKanbanColumnRenders.get(body);
+    if (previous) previous.cancel();
     const cards = getCardsForColumn(columnId);
-    cards.forEach((cardData) => {
-      fragment.appendChild(renderKanbanCard(cardData));
-    });
-    body.replaceChildren(fragment);
+    const buildBatch = (start) => {
+      const fragment = document.createDocumentFragment();
+      const end = Math.min(cards.length, start + KANBAN_RENDER_BATCH);
+      for (let i = start; i < end; i += 1) {
+        fragment.appendChild(renderKanbanCard(cards[i]));
+      }
+      return { fragment, end };
+    };
+    const first = buildBatch(0);
+    body.replaceChildren(first.fragment);
+    let next = first.end;
+    if (next >= cards.length) return;
+
+    let handle = 0;
+    const appendBatch = () => {
+      const batch = buildBatch(next);
+      body.appendChild(batch.fragment);
+      next = batch.end;
+    };
+    const pending = {
+      cancel: () => {
+        cancelIdle(handle);
+        pendingKanbanColumnRenders.delete(body);
+      },
+      flush: () => {
+        pending.cancel();
+        while (next < cards.length) appendBatch();
+      },
+    };
+    const step = () => {
+      appendBatch();
+      if (next < cards.length) {
+        handle = scheduleIdle(step);
+      } else {
+        pendingKanbanColumnRenders.delete(body);
+      }
+    };
+    pendingKanbanColumnRenders.set(body, pending);
+    handle = scheduleIdle(step);
   };
 
   const renderKanbanColumn = (columnId) => {
@@ -1804,14 +1939,24 @@ import {
     if (removeBtn) removeBtn.disabled = !state.kanban.selectedColumnId;
   };
 
+  let kanbanRenderFrame = 0;
+
+  const scheduleKanbanRender = () => {
+    if (kanbanRenderFrame) return;
+    kanbanRenderFrame = requestAnimationFrame(() => {
+      kanbanRenderFrame = 0;
+      renderKanbanBoard();
+      renderKanbanSettings();
+    });
+  };
+
   const loadKanban = async () => {
     const payload = await workflowApi.kanbanGet();
     state.kanban.columns = payload.columns || [];
     state.kanban.cards = payload.cards || [];
     invalidateKanbanCache();
     state.kanban.loaded = true;
-    renderKanbanBoard();
-    renderKanbanSettings();
+    scheduleKanbanRender();
     if (state.kanban.detailsCardId) {
       await refreshDetailsRow(state.kanban.detailsCardId);
       renderDetailsDrawer();
@@ -1855,8 +2000,7 @@ import {
       rollback: () => {
         state.kanban.columns = previousColumns;
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
       },
       request: () => workflowApi.kanbanAddColumn(name),
       onSuccess: (payload) => {
@@ -1864,8 +2008,7 @@ import {
           state.kanban.columns = payload.columns;
         }
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
       },
       onErrorMessage: "Unable to add column. Please try again.",
     });
@@ -1890,8 +2033,7 @@ import {
         state.kanban.columns = previousColumns;
         state.kanban.cards = previousCards;
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
       },
       request: () => workflowApi.kanbanRemoveColumn(columnId),
       onSuccess: (payload) => {
@@ -1902,8 +2044,7 @@ import {
         state.kanban.cards = payload.cards || [];
         state.kanban.selectedColumnId = null;
         invalidateKanbanCache();
-        renderKanbanBoard();
-        renderKanbanSettings();
+        scheduleKanbanRender();
         if (payload && payload.undoId) {
           pushUndo(payload.undoId);
           showToast({
@@ -1923,6 +2064,42 @@ import {
     if (!result) return;
   };
 
+  const CANDIDATE_CARD_FIELDS = [
+    ["candidate-name", "candidate_name"],
+    ["candidate-icims", "icims_id"],
+    ["candidate-employee", "employee_id"],
+    ["candidate-job-id", "job_id"],
+    ["candidate-req-id", "req_id"],
+    ["candidate-job-name", "job_name"],
+    ["candidate-job-location", "job_location"],
+    ["candidate-manager", "manager"],
+  ];
+  // Contact fields live on the candidate row but are submitted under their own payload key.
+  const CANDIDATE_CONTACT_FIELDS = [
+    ["candidate-phone", "Contact Phone", "", "contact_phone"],
+    ["candidate-email", "Contact Email", "", "contact_email"],
+  ];
+  const CANDIDATE_PRE_NEO_FIELDS = [
+    ["candidate-background-provider", "Background Provider"],
+    ["candidate-background-date", "Background Cleared Date"],
+    ["candidate-background-mvr", "Background MVR Flag", "1"],
+    ["candidate-license-type", "License Type"],
+    ["candidate-cori-status", "MA CORI Status"],
+    ["candidate-cori-date", "MA CORI Date"],
+    ["candidate-nh-status", "NH GC Status"],
+    ["candidate-nh-expiration", "NH GC Expiration Date"],
+    ["candidate-nh-id", "NH GC ID Number"],
+    ["candidate-me-status", "ME GC Status"],
+    ["candidate-me-expiration", "ME GC Expiration Date"],
+  ];
+
+  const fillCandidateFields = (fields, source) => {
+    fields.forEach(([id, key, fallback = ""]) => {
+      const input = $(id);
+      if (input) input.value = source[key] || fallback;
+    });
+  };
+
   const openCandidateModal = (mode, columnId, cardData = null) => {
     const modal = $("candidate-modal");
     if (!modal) return;
@@ -1930,28 +2107,8 @@ import {
     const subtitle = $("candidate-modal-subtitle");
     const submit = $("candidate-submit");
     const nameInput = $("candidate-name");
-    const icimsInput = $("candidate-icims");
-    const empInput = $("candidate-employee");
-    const phoneInput = $("candidate-phone");
-    const emailInput = $("candidate-email");
-    const jobIdInput = $("candidate-job-id");
-    const reqIdInput = $("candidate-req-id");
-    const jobNameInput = $("candidate-job-name");
-    const jobLocationInput = $("candidate-job-location");
-    const managerInput = $("candidate-manager");
     const branchSelect = $("candidate-branch");
     const branchOther = $("candidate-branch-other");
-    const backgroundProviderInput = $("candidate-background-provider");
-    const backgroundDateInput = $("candidate-background-date");
-    const backgroundMvrInput = $("candidate-background-mvr");
-    const licenseTypeInput = $("candidate-license-type");
-    const coriStatusInput = $("candidate-cori-status");
-    const coriDateInput = $("candidate-cori-date");
-    const nhStatusInput = $("candidate-nh-status");
-    const nhExpirationInput = $("candidate-nh-expiration");
-    const nhIdInput = $("candidate-nh-id");
-    const meStatusInput = $("candidate-me-status");
-    const meExpirationInput = $("candidate-me-expiration");
 
     state.kanban.activeColumnId = columnId;
     state.kanban.editingCardId = mode === "edit" ? cardData && cardData.uuid : null;
@@ -1963,34 +2120,13 @@ import {
       subtitle.textContent = columnName ? `Column: ${columnName}` : "";
     }
 
-    const fill = (input, value) => {
-      if (input) input.value = value || "";
-    };
+    fillCandidateFields(CANDIDATE_CARD_FIELDS, (mode === "edit" && cardData) || {});
+    fillCandidateFields(CANDIDATE_CONTACT_FIELDS, {});
+    fillCandidateFields(CANDIDATE_PRE_NEO_FIELDS, {});
+    toggleCandidateBackgroundDate("");
+    toggleCandidateLicenseSections("");
 
     if (mode === "edit" && cardData) {
-      fill(nameInput, cardData.candidate_name);
-      fill(icimsInput, cardData.icims_id);
-      fill(empInput, cardData.employee_id);
-      fill(phoneInput, "");
-      fill(emailInput, "");
-      fill(jobIdInput, cardData.job_id);
-      fill(reqIdInput, cardData.req_id);
-      fill(jobNameInput, cardData.job_name);
-      fill(jobLocationInput, cardData.job_location);
-      fill(managerInput, cardData.manager);
-      fill(backgroundProviderInput, "");
-      fill(backgroundDateInput, "");
-      fill(backgroundMvrInput, "1");
-      fill(licenseTypeInput, "");
-      fill(coriStatusInput, "");
-      fill(coriDateInput, "");
-      fill(nhStatusInput, "");
-      fill(nhExpirationInput, "");
-      fill(nhIdInput, "");
-      fill(meStatusInput, "");
-      fill(meExpirationInput, "");
-      toggleCandidateBackgroundDate("");
-      toggleCandidateLicenseSections("");
       if (branchSelect) {
         const branchValue = cardData.branch || "";
         const isOther = !["Salem", "Portland", "Other", ""].includes(branchValue);
@@ -2006,19 +2142,8 @@ import {
         .then((result) => {
           if (state.kanban.editingCardId !== cardData.uuid) return;
           const row = (result && result.row) || {};
-          fill(phoneInput, row["Contact Phone"]);
-          fill(emailInput, row["Contact Email"]);
-          fill(backgroundProviderInput, row["Background Provider"]);
-          fill(backgroundDateInput, row["Background Cleared Date"]);
-          fill(backgroundMvrInput, row["Background MVR Flag"] || "1");
-          fill(licenseTypeInput, row["License Type"]);
-          fill(coriStatusInput, row["MA CORI Status"]);
-          fill(coriDateInput, row["MA CORI Date"]);
-          fill(nhStatusInput, row["NH GC Status"]);
-          fill(nhExpirationInput, row["NH GC Expiration Date"]);
-          fill(nhIdInput, row["NH GC ID Number"]);
-          fill(meStatusInput, row["ME GC Status"]);
-          fill(meExpirationInput, row["ME GC Expiration Date"]);
+          fillCandidateFields(CANDIDATE_CONTACT_FIELDS, row);
+          fillCandidateFields(CANDIDATE_PRE_NEO_FIELDS, row);
           const providerValue = row["Background Provider"] || "";
           toggleCandidateBackgroundDate(providerValue);
           updateCandidateBackgroundMvrFlag(providerValue);
@@ -2026,29 +2151,6 @@ import {
         })
         .catch(() => {});
     } else {
-      fill(nameInput, "");
-      fill(icimsInput, "");
-      fill(empInput, "");
-      fill(phoneInput, "");
-      fill(emailInput, "");
-      fill(jobIdInput, "");
-      fill(reqIdInput, "");
-      fill(jobNameInput, "");
-      fill(jobLocationInput, "");
-      fill(managerInput, "");
-      fill(backgroundProviderInput, "");
-      fill(backgroundDateInput, "");
-      fill(backgroundMvrInput, "1");
-      fill(licenseTypeInput, "");
-      fill(coriStatusInput, "");
-      fill(coriDateInput, "");
-      fill(nhStatusInput, "");
-      fill(nhExpirationInput, "");
-      fill(nhIdInput, "");
-      fill(meStatusInput, "");
-      fill(meExpirationInput, "");
-      toggleCandidateBackgroundDate("");
-      toggleCandidateLicenseSections("");
       if (branchSelect) branchSelect.value = "";
       if (branchOther) {
         branchOther.value = "";
@@ -2074,30 +2176,23 @@ import {
     return `${trimmed}${suffix} Personal Information`;
   };
 
-  const toggleLicenseSections = (value) => {
-    const ma = $("pii-license-ma");
-    const nh = $("pii-license-nh");
-    const me = $("pii-license-me");
-    if (ma) ma.classList.add("hidden");
-    if (nh) nh.classList.add("hidden");
-    if (me) me.classList.add("hidden");
-    if (value === "MA CORI" && ma) ma.classList.remove("hidden");
-    if (value === "NH GC" && nh) nh.classList.remove("hidden");
-    if (value === "ME GC" && me) me.classList.remove("hidden");
-  };
+  const LICENSE_SECTIONS = [
+    ["MA CORI", "license-ma"],
+    ["NH GC", "license-nh"],
+    ["ME GC", "license-me"],
+  ];
 
-  const toggleCandidateLicenseSections = (value) => {
-    const ma = $("candidate-license-ma");
-    const nh = $("candidate-license-nh");
-    const me = $("candidate-license-me");
-    if (ma) ma.classList.add("hidden");
-    if (nh) nh.classList.add("hidden");
-    if (me) me.classList.add("hidden");
-    if (value === "MA CORI" && ma) ma.classList.remove("hidden");
-    if (value === "NH GC" && nh) nh.classList.remove("hidden");
-    if (value === "ME GC" && me) me.classList.remove("hidden");
+  const toggleLicenseSectionsFor = (prefix, value) => {
+    LICENSE_SECTIONS.forEach(([licenseType, suffix]) => {
+      const section = $(`${prefix}-${suffix}`);
+      if (section) section.classList.toggle("hidden", value !== licenseType);
+    });
   };
 
+  const toggleLicenseSections = (value) => toggleLicenseSectionsFor("pii", value);
+
+  const toggleCandidateLicenseSections = (value) => toggleLicenseSectionsFor("candidate", value);
+
   const toggleIdFields = (value) => {
     const row = $("pii-id-row");
     const dates = $("pii-id-dates");
@@ -2208,7 +2303,13 @@ import {
   const UNIFORM_WAIST_OPTIONS = Array.from({ length: 36 }, (_value, index) => String(20 + index));
   const UNIFORM_INSEAM_OPTIONS = Array.from({ length: 10 }, (_value, index) => String(27 + index));
   const UNIFORM_ADD_SHIRT_SIZE_OPTIONS = [...UNIFORM_SHIRT_SIZE_OPTIONS];
+  const UNIFORM_SHIRT_SIZE_SET = new Set(UNIFORM_SHIRT_SIZE_OPTIONS);
+  const UNIFORM_WAIST_SET = new Set(UNIFORM_WAIST_OPTIONS);
+  const UNIFORM_INSEAM_SET = new Set(UNIFORM_INSEAM_OPTIONS);
+  const UNIFORM_ISSUED_COUNT_SET = new Set(UNIFORM_ISSUED_COUNT_OPTIONS);
   let piiUniformInventoryContext = null;
+  let pendingPiiIssuedTypes = null;
+  let piiLoadedRow = null;
   let emailTemplateContext = null;
   let emailTemplateContextOverride = null;
   let emailTemplateBackdropMouseDown = false;
@@ -2217,15 +2318,16 @@ import {
   let emailTemplateLastGeneratedDraft = null;
   let emailTemplateLastGeneratedHtmlBody = "";
 
+  const UNIFORM_INVENTORY_TYPE_ALIASES = new Map([
+    ["shirts", "shirt"],
+    ["pants", "pant"],
+  ]);
+
   const normalizeUniformInventoryType = (value) => {
     const text = String(value || "")
       .trim()
       .toLowerCase();
-    if (text === "shirts") return "shirt";
-    if (text === "pants") return "pant";
-    if (text === "shirt") return "shirt";
-    if (text === "pant") return "pant";
-    return text;
+    return UNIFORM_INVENTORY_TYPE_ALIASES.get(text) ?? text;
   };
 
   const parseUniformInventoryQuantity = (value) => {
@@ -2287,16 +2389,19 @@ import {
     return JSON.stringify(normalized);
   };
 
+  const naturalCollator = new Intl.Collator(undefined, { numeric: true, sensitivity: "base" });
+
   const toSortedUniqueList = (values, numeric = false) => {
     const items = Array.from(
       new Set((values || []).map((value) => String(value || "").trim()).filter(Boolean)),
     );
     if (numeric) {
-      return items.sort((a, b) => Number(a) - Number(b));
+      return items
+        .map((item) => [Number(item), item])
+        .sort((a, b) => a[0] - b[0])
+        .map(([, item]) => item);
     }
-    return items.sort((a, b) =>
-      a.localeCompare(b, undefined, { numeric: true, sensitivity: "base" }),
-    );
+    return items.sort(naturalCollator.compare);
   };
 
   const getMapValues = (map, key) => {
@@ -2312,6 +2417,13 @@ import {
     return `No pants to give out${suffix}`;
   };
 
+  const createSelectOption = (value, label) => {
+    const option = document.createElement("option");
+    option.value = value;
+    option.textContent = label;
+    return option;
+  };
+
   const setSingleSelectOptions = (
     select,
     { options, placeholder, emptyText, value, preserveOrder = false },
@@ -2322,26 +2434,16 @@ import {
           new Set((options || []).map((item) => String(item || "").trim()).filter(Boolean)),
         )
       : toSortedUniqueList(options);
-    select.innerHTML = "";
     if (!normalized.length) {
-      const option = document.createElement("option");
-      option.value = "";
-      option.textContent = emptyText;
-      select.appendChild(option);
+      select.replaceChildren(createSelectOption("", emptyText));
       select.value = "";
       select.disabled = true;
       return;
     }
-    const prompt = document.createElement("option");
-    prompt.value = "";
-    prompt.textContent = placeholder;
-    select.appendChild(prompt);
-    normalized.forEach((item) => {
-      const option = document.createElement("option");
-      option.value = item;
-      option.textContent = item;
-      select.appendChild(option);
-    });
+    select.replaceChildren(
+      createSelectOption("", placeholder),
+      ...normalized.map((item) => createSelectOption(item, item)),
+    );
     select.disabled = false;
     select.value = normalized.includes(value) ? value : "";
   };
@@ -2349,22 +2451,14 @@ import {
   const setMultiSelectOptions = (select, { options, emptyText, values }) => {
     if (!select) return;
     const normalized = toSortedUniqueList(options);
-    select.innerHTML = "";
     if (!normalized.length) {
-      const option = document.createElement("option");
-      option.value = "";
-      option.textContent = emptyText;
+      const option = createSelectOption("", emptyText);
       option.disabled = true;
-      select.appendChild(option);
+      select.replaceChildren(option);
       select.disabled = true;
       return;
     }
-    normalized.forEach((item) => {
-      const option = document.createElement("option");
-      option.value = item;
-      option.textContent = item;
-      select.appendChild(option);
-    });
+    select.replaceChildren(...normalized.map((item) => createSelectOption(item, item)));
     select.disabled = false;
     setMultiSelectValues(select, normalizeUniformTypeList(values || [], normalized));
   };
@@ -2429,19 +2523,23 @@ import {
     const pantsAlterationsBySize = new Map();
 
     (Array.isArray(rows) ? rows : []).forEach((row) => {
-      const rowBranch = String((row && row.Branch) || "").trim();
-      if (normalizedBranch && rowBranch.toLowerCase() !== normalizedBranch) return;
-      const rawType = normalizeUniformInventoryType(row && row.Type);
-      const size = String((row && row.Size) || "").trim();
-      const parsed = parsePantsSize(size);
-      const storedWaist = normalizeUniformMeasurement(row && row.Waist);
-      const storedInseam = normalizeUniformMeasurement(row && row.Inseam);
-      const waist = storedWaist || normalizeUniformMeasurement(parsed.waist);
-      const inseam = storedInseam || normalizeUniformMeasurement(parsed.inseam);
+      if (!row) return;
+      const { Branch, Quantity, Type, Size, Waist, Inseam, Alteration } = row;
+      if (normalizedBranch && String(Branch || "").trim().toLowerCase() !== normalizedBranch) {
+        return;
+      }
+      if (parseUniformInventoryQuantity(Quantity) <= 0) return;
+      const rawType = normalizeUniformInventoryType(Type);
+      const size = String(Size || "").trim();
+      let waist = normalizeUniformMeasurement(Waist);
+      let inseam = normalizeUniformMeasurement(Inseam);
+      if (!waist || !inseam) {
+        const parsed = parsePantsSize(size);
+        waist = waist || normalizeUniformMeasurement(parsed.waist);
+        inseam = inseam || normalizeUniformMeasurement(parsed.inseam);
+      }
       const hasPantsMeasurements = !!(waist && inseam);
-      const alteration = String((row && row.Alteration) || "").trim();
-      const quantity = parseUniformInventoryQuantity(row && row.Quantity);
-      if (quantity <= 0) return;
+      const alteration = String(Alteration || "").trim();
 
       let type = rawType;
       if (rawType === "shirt" && hasPantsMeasurements) type = "pant";
@@ -2490,12 +2588,12 @@ import {
     };
   };
 
-  const loadPiiUniformInventoryContext = async (branch) => {
+  const loadPiiUniformInventoryRows = async () => {
     try {
       const table = await workflowApi.dbGetTable("uniform_inventory", "current");
-      return buildPiiUniformInventoryContext((table && table.rows) || [], branch);
+      return (table && table.rows) || [];
     } catch (error) {
-      return buildPiiUniformInventoryContext([], branch);
+      return [];
     }
   };
 
@@ -2506,6 +2604,8 @@ import {
     const shirtTypeInput = $("pii-shirt-type");
     const pantsTypeInput = $("pii-pants-type");
     const context = piiUniformInventoryContext || buildPiiUniformInventoryContext([], "");
+    const pending = pendingPiiIssuedTypes || {};
+    pendingPiiIssuedTypes = null;
     const shirtSize = shirtSizeInput ? shirtSizeInput.value.trim() : "";
     const waist = waistInput ? waistInput.value.trim() : "";
     const inseam = inseamInput ? inseamInput.value.trim() : "";
@@ -2516,10 +2616,12 @@ import {
     const pantsOptions = pantsSize
       ? toSortedUniqueList(getMapValues(context.pantsAlterationsBySize, pantsSize))
       : context.pantsAlterationsAll;
-    const currentShirtTypes = shirtTypes || getMultiSelectValues(shirtTypeInput);
+    const currentShirtTypes =
+      shirtTypes || pending.shirtTypes || getMultiSelectValues(shirtTypeInput);
+    const requestedPantsType = pantsType ?? pending.pantsType;
     const currentPantsType =
-      pantsType !== null && pantsType !== undefined
-        ? String(pantsType || "").trim()
+      requestedPantsType !== null && requestedPantsType !== undefined
+        ? String(requestedPantsType || "").trim()
         : pantsTypeInput
           ? pantsTypeInput.value.trim()
           : "";
@@ -2566,6 +2668,7 @@ import {
     if (!modal || !cardData) return;
     const title = $("pii-modal-title");
     state.kanban.piiCandidateId = cardData.uuid;
+    const inventoryRowsRequest = loadPiiUniformInventoryRows();
 
     let result = null;
     try {
@@ -2578,10 +2681,14 @@ import {
       return;
     }
     const row = (result && result.row) || {};
+    piiLoadedRow = row;
     const displayName =
       result && result.candidateName ? result.candidateName : cardData.candidate_name;
     const uniformBranch = String(cardData.branch || row["Branch"] || "").trim();
-    piiUniformInventoryContext = await loadPiiUniformInventoryContext(uniformBranch);
+    piiUniformInventoryContext = buildPiiUniformInventoryContext(
+      await inventoryRowsRequest,
+      uniformBranch,
+    );
 
     if (title) title.textContent = getPossessiveName(displayName);
 
@@ -2605,71 +2712,46 @@ import {
     setValue("pii-account-type", row["Account Type"]);
     setValue("pii-routing", row["Routing Number"]);
     setValue("pii-account", row["Account Number"]);
+    const rowText = (key) => String(row[key] || "").trim();
     const parsedPants = parsePantsSize(row["Pants Size"]);
-    const waistValue = String(row["Waist"] || "").trim() || parsedPants.waist;
-    const inseamValue = String(row["Inseam"] || "").trim() || parsedPants.inseam;
+    const waistValue = rowText("Waist") || parsedPants.waist;
+    const inseamValue = rowText("Inseam") || parsedPants.inseam;
     const parsedIssuedPants = parsePantsSize(row["Issued Pants Size"] || row["Pants Size"]);
-    const issuedShirtSizeValue =
-      String(row["Issued Shirt Size"] || "").trim() || String(row["Shirt Size"] || "").trim();
-    const issuedWaistValue =
-      String(row["Issued Waist"] || "").trim() || parsedIssuedPants.waist || waistValue;
-    const issuedInseamValue =
-      String(row["Issued Inseam"] || "").trim() || parsedIssuedPants.inseam || inseamValue;
+    const issuedShirtSizeValue = rowText("Issued Shirt Size") || rowText("Shirt Size");
+    const issuedWaistValue = rowText("Issued Waist") || parsedIssuedPants.waist || waistValue;
+    const issuedInseamValue = rowText("Issued Inseam") || parsedIssuedPants.inseam || inseamValue;
     const context =
       piiUniformInventoryContext || buildPiiUniformInventoryContext([], uniformBranch);
-    setSingleSelectOptions($("pii-shirt"), {
-      options: UNIFORM_SHIRT_SIZE_OPTIONS,
-      placeholder: "Shirt Size",
-      emptyText: "No shirt sizes available.",
-      value: String(row["Shirt Size"] || "").trim(),
-      preserveOrder: true,
-    });
-    setSingleSelectOptions($("pii-waist"), {
-      options: UNIFORM_WAIST_OPTIONS,
-      placeholder: "Waist",
-      emptyText: "No waist sizes available.",
-      value: waistValue,
-      preserveOrder: true,
-    });
-    setSingleSelectOptions($("pii-inseam"), {
-      options: UNIFORM_INSEAM_OPTIONS,
-      placeholder: "Inseam",
-      emptyText: "No inseam sizes available.",
-      value: inseamValue,
-      preserveOrder: true,
-    });
-    setSingleSelectOptions($("pii-issued-shirt-size"), {
+    const shirtSizes = {
       options: UNIFORM_SHIRT_SIZE_OPTIONS,
-      placeholder: "Issued Shirt Size",
       emptyText: "No shirt sizes available.",
-      value: issuedShirtSizeValue,
-      preserveOrder: true,
-    });
-    setSingleSelectOptions($("pii-issued-waist"), {
-      options: UNIFORM_WAIST_OPTIONS,
-      placeholder: "Issued Waist",
-      emptyText: "No waist sizes available.",
-      value: issuedWaistValue,
-      preserveOrder: true,
-    });
-    setSingleSelectOptions($("pii-issued-inseam"), {
+    };
+    const waistSizes = { options: UNIFORM_WAIST_OPTIONS, emptyText: "No waist sizes available." };
+    const inseamSizes = {
       options: UNIFORM_INSEAM_OPTIONS,
-      placeholder: "Issued Inseam",
       emptyText: "No inseam sizes available.",
-      value: issuedInseamValue,
-      preserveOrder: true,
-    });
+    };
+    const setSizeSelect = (id, sizes, placeholder, value) => {
+      setSingleSelectOptions($(id), { ...sizes, placeholder, value, preserveOrder: true });
+    };
+    setSizeSelect("pii-shirt", shirtSizes, "Shirt Size", rowText("Shirt Size"));
+    setSizeSelect("pii-waist", waistSizes, "Waist", waistValue);
+    setSizeSelect("pii-inseam", inseamSizes, "Inseam", inseamValue);
+    setSizeSelect("pii-issued-shirt-size", shirtSizes, "Issued Shirt Size", issuedShirtSizeValue);
+    setSizeSelect("pii-issued-waist", waistSizes, "Issued Waist", issuedWaistValue);
+    setSizeSelect("pii-issued-inseam", inseamSizes, "Issued Inseam", issuedInseamValue);
     const uniformsIssuedCheckbox = $("pii-uniforms-issued");
     if (uniformsIssuedCheckbox) {
       uniformsIssuedCheckbox.checked = isUniformIssued(row["Uniforms Issued"]);
     }
-    updatePiiIssuedTypeOptions({
+    // The issued type selects are only filled once their section is shown.
+    pendingPiiIssuedTypes = {
       shirtTypes: splitUniformTypeList(
         row["Issued Shirt Type"] || row["Shirt Type"],
         context.shirtAlterationsAll,
       ),
       pantsType: row["Issued Pants Type"] || row["Pants Type"],
-    });
+    };
     setValue("pii-shirts-given", row["Issued Shirts Given"] || row["Shirts Given"]);
     setValue("pii-pants-given", row["Issued Pants Given"] || row["Pants Given"]);
     setValue("pii-emergency-name", row["Emergency Contact Name"]);
@@ -2699,24 +2781,34 @@ import {
     if (modal) modal.classList.add("hidden");
     state.kanban.piiCandidateId = null;
     piiUniformInventoryContext = null;
+    pendingPiiIssuedTypes = null;
+    piiLoadedRow = null;
+  };
+
+  const readInputValue = (id) => {
+    const input = $(id);
+    return input ? input.value.trim() : "";
   };
 
   const collectPiiPayload = () => {
-    const value = (id) => ($(id) ? $(id).value.trim() : "");
     const uniformsIssuedCheckbox = $("pii-uniforms-issued");
     const uniformsIssued = !!(uniformsIssuedCheckbox && uniformsIssuedCheckbox.checked);
     const shirtTypes = getMultiSelectValues($("pii-shirt-type"));
-    const waist = value("pii-waist");
-    const inseam = value("pii-inseam");
-    const issuedShirtSize = value("pii-issued-shirt-size");
-    const issuedWaist = value("pii-issued-waist");
-    const issuedInseam = value("pii-issued-inseam");
+    const waist = readInputValue("pii-waist");
+    const inseam = readInputValue("pii-inseam");
+    const issuedShirtSize = readInputValue("pii-issued-shirt-size");
+    const issuedWaist = readInputValue("pii-issued-waist");
+    const issuedInseam = readInputValue("pii-issued-inseam");
+    const issuedShirtType = uniformsIssued ? serializeUniformTypeList(shirtTypes) : "";
+    const shirtsGiven = uniformsIssued ? readInputValue("pii-shirts-given") : "";
+    const pantsType = uniformsIssued ? readInputValue("pii-pants-type") : "";
+    const pantsGiven = uniformsIssued ? readInputValue("pii-pants-given") : "";
     return {
-      "Bank Name": value("pii-bank-name"),
-      "Account Type": value("pii-account-type"),
-      "Routing Number": value("pii-routing"),
-      "Account Number": value("pii-account"),
-      "Shirt Size": value("pii-shirt"),
+      "Bank Name": readInputValue("pii-bank-name"),
+      "Account Type": readInputValue("pii-account-type"),
+      "Routing Number": readInputValue("pii-routing"),
+      "Account Number": readInputValue("pii-account"),
+      "Shirt Size": readInputValue("pii-shirt"),
       Waist: waist,
       Inseam: inseam,
       "Pants Size": buildPantsSize(waist, inseam),
@@ -2725,55 +2817,59 @@ import {
       "Issued Inseam": uniformsIssued ? issuedInseam : "",
       "Issued Pants Size": uniformsIssued ? buildPantsSize(issuedWaist, issuedInseam) : "",
       "Uniforms Issued": uniformsIssued ? "Yes" : "",
-      "Issued Shirt Type": uniformsIssued ? serializeUniformTypeList(shirtTypes) : "",
-      "Issued Shirts Given": uniformsIssued ? value("pii-shirts-given") : "",
-      "Issued Pants Type": uniformsIssued ? value("pii-pants-type") : "",
-      "Issued Pants Given": uniformsIssued ? value("pii-pants-given") : "",
-      "Shirt Type": uniformsIssued ? serializeUniformTypeList(shirtTypes) : "",
-      "Shirts Given": uniformsIssued ? value("pii-shirts-given") : "",
-      "Pants Type": uniformsIssued ? value("pii-pants-type") : "",
-      "Pants Given": uniformsIssued ? value("pii-pants-given") : "",
+      "Issued Shirt Type": issuedShirtType,
+      "Issued Shirts Given": shirtsGiven,
+      "Issued Pants Type": pantsType,
+      "Issued Pants Given": pantsGiven,
+      "Shirt Type": issuedShirtType,
+      "Shirts Given": shirtsGiven,
+      "Pants Type": pantsType,
+      "Pants Given": pantsGiven,
       "Boots Size": "",
-      "Emergency Contact Name": value("pii-emergency-name"),
-      "Emergency Contact Relationship": value("pii-emergency-relationship"),
-      "Emergency Contact Phone": value("pii-emergency-phone"),
-      "ID Type": value("pii-id-type"),
-      "State Abbreviation": value("pii-id-state"),
-      "ID Number": value("pii-id-number"),
-      DOB: value("pii-id-dob"),
-      EXP: value("pii-id-exp"),
-      "Other ID Type": value("pii-id-other-type"),
-      Social: value("pii-social"),
-      "Additional Details": value("pii-additional-details"),
+      "Emergency Contact Name": readInputValue("pii-emergency-name"),
+      "Emergency Contact Relationship": readInputValue("pii-emergency-relationship"),
+      "Emergency Contact Phone": readInputValue("pii-emergency-phone"),
+      "ID Type": readInputValue("pii-id-type"),
+      "State Abbreviation": readInputValue("pii-id-state"),
+      "ID Number": readInputValue("pii-id-number"),
+      DOB: readInputValue("pii-id-dob"),
+      EXP: readInputValue("pii-id-exp"),
+      "Other ID Type": readInputValue("pii-id-other-type"),
+      Social: readInputValue("pii-social"),
+      "Additional Details": readInputValue("pii-additional-details"),
     };
   };
 
-  const validatePiiPayload = async (payload) => {
-    const phoneFields = [
-      { label: "Emergency Contact Phone", value: payload["Emergency Contact Phone"] },
-    ];
-    const dateFields = [
-      { label: "DOB", value: payload["DOB"] },
-      { label: "EXP", value: payload["EXP"] },
-    ];
+  const PII_DATE_FIELDS = ["DOB", "EXP"];
+  const CANDIDATE_PRE_NEO_DATE_FIELDS = [
+    "Background Cleared Date",
+    "MA CORI Date",
+    "NH GC Expiration Date",
+    "ME GC Expiration Date",
+  ];
 
-    for (const field of phoneFields) {
-      if (field.value && !isPhoneLikeValid(field.value)) {
-        await showMessageModal("Invalid Format", `${field.label} must be in 123-123-1234 format.`);
-        return false;
-      }
-    }
+  const validateDateFields = async (payload, fields) => {
+    const invalid = fields.find((field) => payload[field] && !isDateLikeValid(payload[field]));
+    if (!invalid) return true;
+    await showMessageModal(
+      "Invalid Format",
+      `${invalid} must be in MM/DD/YY or MM/DD/YYYY format.`,
+    );
+    return false;
+  };
 
-    for (const field of dateFields) {
-      if (field.value && !isDateLikeValid(field.value)) {
-        await showMessageModal(
-          "Invalid Format",
-          `${field.label} must be in MM/DD/YY or MM/DD/YYYY format.`,
-        );
-        return false;
-      }
+  const validatePiiPayload = async (payload) => {
+    const emergencyPhone = payload["Emergency Contact Phone"];
+    if (emergencyPhone && !isPhoneLikeValid(emergencyPhone)) {
+      await showMessageModal(
+        "Invalid Format",
+        "Emergency Contact Phone must be in 123-123-1234 format.",
+      );
+      return false;
     }
 
+    if (!(await validateDateFields(payload, PII_DATE_FIELDS))) return false;
+
     if (payload["Routing Number"] && payload["Routing Number"].length > 9) {
       await showMessageModal("Invalid Routing Number", "Routing Number must be 9 digits or fewer.");
       return false;
@@ -2838,9 +2934,9 @@ import {
       payload["Issued Shirt Type"] || payload["Shirt Type"] || "",
     ).trim();
     const issuedPantsSize = buildPantsSize(issuedWaistValue, issuedInseamValue);
-    const allowedShirtSizes = new Set(UNIFORM_SHIRT_SIZE_OPTIONS);
-    const allowedWaists = new Set(UNIFORM_WAIST_OPTIONS);
-    const allowedInseams = new Set(UNIFORM_INSEAM_OPTIONS);
+    const allowedShirtSizes = UNIFORM_SHIRT_SIZE_SET;
+    const allowedWaists = UNIFORM_WAIST_SET;
+    const allowedInseams = UNIFORM_INSEAM_SET;
     const allowedShirtTypes = new Set(
       issuedShirtSizeValue
         ? getMapValues(context.shirtAlterationsBySize, issuedShirtSizeValue)
@@ -2851,13 +2947,8 @@ import {
         ? getMapValues(context.pantsAlterationsBySize, issuedPantsSize)
         : context.pantsAlterationsAll,
     );
-    const isValidDropdownValue = (value, allowedOptions) => {
-      if (!value) return true;
-      const text = String(value);
-      if (allowedOptions instanceof Set) return allowedOptions.has(text);
-      if (Array.isArray(allowedOptions)) return allowedOptions.includes(text);
-      return false;
-    };
+    const isValidDropdownValue = (value, allowedOptions) =>
+      !value || allowedOptions.has(String(value));
 
     if (!isValidDropdownValue(shirtSizeValue, allowedShirtSizes)) {
       await showMessageModal(
@@ -2895,14 +2986,14 @@ import {
       );
       return false;
     }
-    if (!isValidDropdownValue(issuedShirtsGivenValue, UNIFORM_ISSUED_COUNT_OPTIONS)) {
+    if (!isValidDropdownValue(issuedShirtsGivenValue, UNIFORM_ISSUED_COUNT_SET)) {
       await showMessageModal(
         "Invalid Shirts Given",
         "Issued Shirts Given must be selected as a number from 1 to 4.",
       );
       return false;
     }
-    if (!isValidDropdownValue(issuedPantsGivenValue, UNIFORM_ISSUED_COUNT_OPTIONS)) {
+    if (!isValidDropdownValue(issuedPantsGivenValue, UNIFORM_ISSUED_COUNT_SET)) {
       await showMessageModal(
         "Invalid Pants Given",
         "Issued Pants Given must be selected as a number from 1 to 4.",
@@ -2997,8 +3088,13 @@ import {
     const payload = collectPiiPayload();
     const ok = await validatePiiPayload(payload);
     if (!ok) return;
+    const loadedRow = piiLoadedRow || {};
+    const changes = {};
+    Object.keys(payload).forEach((key) => {
+      if (payload[key] !== String(loadedRow[key] ?? "")) changes[key] = payload[key];
+    });
     try {
-      await workflowApi.piiSave(candidateId, payload);
+      if (Object.keys(changes).length) await workflowApi.piiSave(candidateId, changes);
     } catch (error) {
       await showMessageModal(
         "Save Failed",
@@ -3014,16 +3110,6 @@ import {
   };
 
   const buildCandidatePayload = () => {
-    const nameInput = $("candidate-name");
-    const icimsInput = $("candidate-icims");
-    const empInput = $("candidate-employee");
-    const phoneInput = $("candidate-phone");
-    const emailInput = $("candidate-email");
-    const jobIdInput = $("candidate-job-id");
-    const reqIdInput = $("candidate-req-id");
-    const jobNameInput = $("candidate-job-name");
-    const jobLocationInput = $("candidate-job-location");
-    const managerInput = $("candidate-manager");
     const branchSelect = $("candidate-branch");
     const branchOther = $("candidate-branch-other");
 
@@ -3032,57 +3118,27 @@ import {
         ? (branchOther && branchOther.value.trim()) || "Other"
         : (branchSelect && branchSelect.value) || "";
 
-    return {
-      column_id: state.kanban.activeColumnId,
-      candidate_name: nameInput ? nameInput.value.trim() : "",
-      icims_id: icimsInput ? icimsInput.value.trim() : "",
-      employee_id: empInput ? empInput.value.trim() : "",
-      contact_phone: phoneInput ? phoneInput.value.trim() : "",
-      contact_email: emailInput ? emailInput.value.trim() : "",
-      job_id: jobIdInput ? jobIdInput.value.trim() : "",
-      req_id: reqIdInput ? reqIdInput.value.trim() : "",
-      job_name: jobNameInput ? jobNameInput.value.trim() : "",
-      job_location: jobLocationInput ? jobLocationInput.value.trim() : "",
-      manager: managerInput ? managerInput.value.trim() : "",
-      branch: branchValue,
-    };
+    const payload = { column_id: state.kanban.activeColumnId };
+    CANDIDATE_CARD_FIELDS.forEach(([id, key]) => {
+      payload[key] = readInputValue(id);
+    });
+    CANDIDATE_CONTACT_FIELDS.forEach(([id, , , payloadKey]) => {
+      payload[payloadKey] = readInputValue(id);
+    });
+    payload.branch = branchValue;
+    return payload;
   };
 
   const collectCandidatePreNeoPayload = () => {
-    const value = (id) => ($(id) ? $(id).value.trim() : "");
-    return {
-      "Background Provider": value("candidate-background-provider"),
-      "Background Cleared Date": value("candidate-background-date"),
-      "Background MVR Flag": value("candidate-background-mvr") || "1",
-      "License Type": value("candidate-license-type"),
-      "MA CORI Status": value("candidate-cori-status"),
-      "MA CORI Date": value("candidate-cori-date"),
-      "NH GC Status": value("candidate-nh-status"),
-      "NH GC Expiration Date": value("candidate-nh-expiration"),
-      "NH GC ID Number": value("candidate-nh-id"),
-      "ME GC Status": value("candidate-me-status"),
-      "ME GC Expiration Date": value("candidate-me-expiration"),
-    };
+    const payload = {};
+    CANDIDATE_PRE_NEO_FIELDS.forEach(([id, key, fallback = ""]) => {
+      payload[key] = readInputValue(id) || fallback;
+    });
+    return payload;
   };
 
-  const validateCandidatePreNeoPayload = async (payload) => {
-    const dateFields = [
-      { label: "Background Cleared Date", value: payload["Background Cleared Date"] },
-      { label: "MA CORI Date", value: payload["MA CORI Date"] },
-      { label: "NH GC Expiration Date", value: payload["NH GC Expiration Date"] },
-      { label: "ME GC Expiration Date", value: payload["ME GC Expiration Date"] },
-    ];
-    for (const field of dateFields) {
-      if (field.value && !isDateLikeValid(field.value)) {
-        await showMessageModal(
-          "Invalid Format",
-          `${field.label} must be in MM/DD/YY or MM/DD/YYYY format.`,
-        );
-        return false;
-      }
-    }
-    return true;
-  };
+  const validateCandidatePreNeoPayload = (payload) =>
+    validateDateFields(payload, CANDIDATE_PRE_NEO_DATE_FIELDS);
 
   const persistCandidatePreNeoPayload = async (candidateId, payload) => {
     if (!candidateId) return;
@@ -3127,7 +3183,7 @@ import {
       const targetColumnId = payload.column_id;
       const result = await withOptimisticUpdate({
         apply: () => {
-          const card = state.kanban.cards.find((item) => item.uuid === cardId);
+          const card = getKanbanCard(cardId);
           if (card) Object.assign(card, payload);
           invalidateKanbanCache();
           renderKanbanColumn(targetColumnId);
@@ -3215,7 +3271,7 @@ import {
   };
 
   const moveCardToColumn = async (cardId, columnId, orderedIds = null) => {
-    const card = state.kanban.cards.find((item) => item.uuid === cardId);
+    const card = getKanbanCard(cardId);
     if (!card) return;
     const fromColumnId = card.column_id;
     const sameColumn = fromColumnId === columnId;
@@ -3250,12 +3306,20 @@ import {
     }
 
     try {
-      if (!sameColumn) {
-        await workflowApi.kanbanUpdateCard(cardId, { column_id: columnId });
-      }
-      await persistColumnOrder(columnId);
-      if (!sameColumn && fromColumnId) {
-        await persistColumnOrder(fromColumnId);
+      if (sameColumn) {
+        await persistColumnOrder(columnId);
+      } else {
+        const data = await workflowApi.kanbanMoveCard(
+          cardId,
+          columnId,
+          getOrderedIdsForColumn(columnId),
+          fromColumnId,
+          fromColumnId ? getOrderedIdsForColumn(fromColumnId) : [],
+        );
+        if (data.cards) {
+          state.kanban.cards = data.cards;
+          invalidateKanbanCache();
+        }
       }
     } catch (error) {
       console.error("Move card error", error);
@@ -3263,54 +3327,39 @@ import {
     }
   };
 
+  const bindInputFormatters = (root, formatters) => {
+    if (!root) return;
+    const formatById = new Map(formatters);
+    root.addEventListener("input", (event) => {
+      const input = event.target;
+      const format = formatById.get(input.id);
+      if (!format) return;
+      const next = format(input.value);
+      if (next !== input.value) input.value = next;
+    });
+  };
+
   const initCandidateInputs = () => {
-    const nameInput = $("candidate-name");
-    const jobLocationInput = $("candidate-job-location");
-    const managerInput = $("candidate-manager");
     const branchOther = $("candidate-branch-other");
-    const icimsInput = $("candidate-icims");
-    const empInput = $("candidate-employee");
     const branchSelect = $("candidate-branch");
-    const contactPhone = $("candidate-phone");
     const backgroundProvider = $("candidate-background-provider");
     const licenseType = $("candidate-license-type");
-    const nhId = $("candidate-nh-id");
-    const backgroundDate = $("candidate-background-date");
-    const coriDate = $("candidate-cori-date");
-    const nhExpiration = $("candidate-nh-expiration");
-    const meExpiration = $("candidate-me-expiration");
-
-    const letterInputs = [nameInput, jobLocationInput, managerInput, branchOther].filter(Boolean);
-    letterInputs.forEach((input) => {
-      input.addEventListener("input", () => {
-        input.value = sanitizeLetters(input.value);
-      });
-    });
-
-    const numericInputs = [icimsInput, empInput].filter(Boolean);
-    numericInputs.forEach((input) => {
-      input.addEventListener("input", () => {
-        input.value = sanitizeNumbers(input.value).slice(0, 12);
-      });
-    });
-
-    if (contactPhone) {
-      contactPhone.addEventListener("input", () => {
-        contactPhone.value = formatPhoneLike(contactPhone.value);
-      });
-    }
-
-    [backgroundDate, coriDate, nhExpiration, meExpiration].filter(Boolean).forEach((input) => {
-      input.addEventListener("input", () => {
-        input.value = formatDateLike(input.value);
-      });
-    });
-
-    if (nhId) {
-      nhId.addEventListener("input", () => {
-        nhId.value = sanitizeAlphaNum(nhId.value);
-      });
-    }
+    const sanitizeCandidateId = (value) => sanitizeNumbers(value).slice(0, 12);
+
+    bindInputFormatters($("candidate-modal"), [
+      ["candidate-name", sanitizeLetters],
+      ["candidate-job-location", sanitizeLetters],
+      ["candidate-manager", sanitizeLetters],
+      ["candidate-branch-other", sanitizeLetters],
+      ["candidate-icims", sanitizeCandidateId],
+      ["candidate-employee", sanitizeCandidateId],
+      ["candidate-phone", formatPhoneLike],
+      ["candidate-background-date", formatDateLike],
+      ["candidate-cori-date", formatDateLike],
+      ["candidate-nh-expiration", formatDateLike],
+      ["candidate-me-expiration", formatDateLike],
+      ["candidate-nh-id", sanitizeAlphaNum],
+    ]);
 
     if (branchSelect && branchOther) {
       branchSelect.addEventListener("change", () => {
@@ -3338,43 +3387,25 @@ import {
   };
 
   const initPiiInputs = () => {
-    const backgroundDate = $("pii-background-date");
-    const coriDate = $("pii-cori-date");
-    const nhExpiration = $("pii-nh-expiration");
-    const meExpiration = $("pii-me-expiration");
-    const idDob = $("pii-id-dob");
-    const idExp = $("pii-id-exp");
-    const emergencyPhone = $("pii-emergency-phone");
-    const dateInputs = [backgroundDate, coriDate, nhExpiration, meExpiration, idDob, idExp].filter(
-      Boolean,
-    );
-    dateInputs.forEach((input) => {
-      input.addEventListener("input", () => {
-        input.value = formatDateLike(input.value);
-      });
-    });
-
-    if (emergencyPhone) {
-      emergencyPhone.addEventListener("input", () => {
-        emergencyPhone.value = formatPhoneLike(emergencyPhone.value);
-      });
-    }
-
-    const bankName = $("pii-bank-name");
-    const emergencyName = $("pii-emergency-name");
-    const emergencyRelationship = $("pii-emergency-relationship");
-    [bankName, emergencyName, emergencyRelationship].filter(Boolean).forEach((input) => {
-      input.addEventListener("input", () => {
-        input.value = sanitizeLetters(input.value);
-      });
-    });
-
-    const nhId = $("pii-nh-id");
-    if (nhId) {
-      nhId.addEventListener("input", () => {
-        nhId.value = sanitizeAlphaNum(nhId.value);
-      });
-    }
+    bindInputFormatters($("pii-modal"), [
+      ["pii-background-date", formatDateLike],
+      ["pii-cori-date", formatDateLike],
+      ["pii-nh-expiration", formatDateLike],
+      ["pii-me-expiration", formatDateLike],
+      ["pii-id-dob", formatDateLike],
+      ["pii-id-exp", formatDateLike],
+      ["pii-emergency-phone", formatPhoneLike],
+      ["pii-bank-name", sanitizeLetters],
+      ["pii-emergency-name", sanitizeLetters],
+      ["pii-emergency-relationship", sanitizeLetters],
+      ["pii-nh-id", sanitizeAlphaNum],
+      ["pii-id-state", sanitizeStateAbbrev],
+      ["pii-id-number", (value) => sanitizeAlphaNumTight(value).slice(0, 20)],
+      ["pii-id-other-type", (value) => sanitizeAlphaNum(value).slice(0, 24)],
+      ["pii-social", formatSsnLike],
+      ["pii-routing", (value) => sanitizeNumbers(value).slice(0, 9)],
+      ["pii-account", (value) => sanitizeNumbers(value).slice(0, 20)],
+    ]);
 
     const uniformsIssued = $("pii-uniforms-issued");
     if (uniformsIssued) {
@@ -3403,48 +3434,6 @@ import {
       });
     }
 
-    const idState = $("pii-id-state");
-    if (idState) {
-      idState.addEventListener("input", () => {
-        idState.value = sanitizeStateAbbrev(idState.value);
-      });
-    }
-
-    const idNumber = $("pii-id-number");
-    if (idNumber) {
-      idNumber.addEventListener("input", () => {
-        idNumber.value = sanitizeAlphaNumTight(idNumber.value).slice(0, 20);
-      });
-    }
-
-    const idOtherType = $("pii-id-other-type");
-    if (idOtherType) {
-      idOtherType.addEventListener("input", () => {
-        idOtherType.value = sanitizeAlphaNum(idOtherType.value).slice(0, 24);
-      });
-    }
-
-    const social = $("pii-social");
-    if (social) {
-      social.addEventListener("input", () => {
-        social.value = formatSsnLike(social.value);
-      });
-    }
-
-    const routing = $("pii-routing");
-    if (routing) {
-      routing.addEventListener("input", () => {
-        routing.value = sanitizeNumbers(routing.value).slice(0, 9);
-      });
-    }
-
-    const account = $("pii-account");
-    if (account) {
-      account.addEventListener("input", () => {
-        account.value = sanitizeNumbers(account.value).slice(0, 20);
-      });
-    }
-
     const backgroundProvider = $("pii-background-provider");
     if (backgroundProvider) {
       backgroundProvider.addEventListener("change", () => {
@@ -3616,6 +3605,8 @@ import {
     const board = $("kanban-board");
     if (!board || board.dataset.wheelScroll) return;
     board.dataset.wheelScroll = "1";
+    let pendingScroll = 0;
+    let scrollFrame = 0;
     board.addEventListener(
       "wheel",
       (event) => {
@@ -3636,14 +3627,88 @@ import {
         }
 
         if (event.deltaY !== 0) {
-          board.scrollLeft += event.deltaY;
+          pendingScroll += event.deltaY;
           event.preventDefault();
+          if (scrollFrame) return;
+          scrollFrame = requestAnimationFrame(() => {
+            scrollFrame = 0;
+            board.scrollLeft += pendingScroll;
+            pendingScroll = 0;
+          });
         }
       },
       { passive: false },
     );
   };
 
+  const initKanbanCardEvents = () => {
+    const board = $("kanban-board");
+    if (!board || board.dataset.cardEvents) return;
+    board.dataset.cardEvents = "1";
+    const findCard = (event) => {
+      if (!(event.target instanceof Element)) return null;
+      const cardEl = event.target.closest(".kanban-card");
+      if (!cardEl) return null;
+      const cardData = getKanbanCard(cardEl.dataset.cardId);
+      return cardData ? { cardEl, cardData } : null;
+    };
+
+    board.addEventListener("dragstart", (event) => {
+      const match = findCard(event);
+      if (!match) return;
+      state.kanban.draggingCardId = match.cardData.uuid;
+      match.cardEl.classList.add("dragging");
+      event.dataTransfer.setData("text/plain", match.cardData.uuid);
+      event.dataTransfer.effectAllowed = "move";
+    });
+
+    board.addEventListener("dragend", (event) => {
+      if (!(event.target instanceof Element)) return;
+      const cardEl = event.target.closest(".kanban-card");
+      if (!cardEl) return;
+      state.kanban.draggingCardId = null;
+      cardEl.classList.remove("dragging");
+    });
+
+    board.addEventListener("click", (event) => {
+      if (state.kanban.draggingCardId) return;
+      const match = findCard(event);
+      if (match) openDetailsDrawer(match.cardData);
+    });
+    board.addEventListener("dblclick", (event) => {
+      if (state.kanban.draggingCardId) return;
+      const match = findCard(event);
+      if (match) openCandidateModal("edit", match.cardData.column_id, match.cardData);
+    });
+  };
+
+  let weeklyDayTemplate = null;
+
+  const getWeeklyDayTemplate = () => {
+    if (weeklyDayTemplate) return weeklyDayTemplate;
+    const container = document.createElement("div");
+    container.className = "weekly__day";
+    const header = document.createElement("div");
+    header.className = "weekly__day-header";
+    const title = document.createElement("div");
+    title.className = "weekly__day-title";
+    const timeWrap = document.createElement("div");
+    timeWrap.className = "weekly__time";
+    const startInput = document.createElement("input");
+    startInput.type = "text";
+    startInput.placeholder = "Start";
+    const endInput = document.createElement("input");
+    endInput.type = "text";
+    endInput.placeholder = "End";
+    timeWrap.append(startInput, endInput);
+    header.append(title, timeWrap);
+    const textarea = document.createElement("textarea");
+    textarea.placeholder = "";
+    container.append(header, textarea);
+    weeklyDayTemplate = container;
+    return weeklyDayTemplate;
+  };
+
   const openWeeklyTracker = async () => {
     const panel = $("weekly-panel");
     const form = $("weekly-form");
@@ -3652,7 +3717,6 @@ import {
     if (state.flyouts.todo) closeTodoPanel();
     positionFlyout(panel);
     const data = await workflowApi.weeklyGet();
-    form.innerHTML = "";
     if (range) {
       range.textContent = `Week of ${data.week_start} to ${data.week_end}`;
     }
@@ -3660,42 +3724,24 @@ import {
     const days = ["Friday", "Saturday", "Sunday", "Monday", "Tuesday", "Wednesday", "Thursday"];
     const grid = document.createElement("div");
     grid.className = "weekly__grid";
+    const template = getWeeklyDayTemplate();
     days.forEach((day) => {
       const info =
         data.entries && data.entries[day] ? data.entries[day] : { start: "", end: "", content: "" };
-      const container = document.createElement("div");
-      container.className = "weekly__day";
-
-      const header = document.createElement("div");
-      header.className = "weekly__day-header";
-      const title = document.createElement("div");
-      title.className = "weekly__day-title";
+      const container = template.cloneNode(true);
+      const [header, textarea] = container.children;
+      const [title, timeWrap] = header.children;
+      const [startInput, endInput] = timeWrap.children;
       title.textContent = day;
-
-      const timeWrap = document.createElement("div");
-      timeWrap.className = "weekly__time";
-      const startInput = document.createElement("input");
-      startInput.type = "text";
       startInput.name = `${day}__start`;
-      startInput.placeholder = "Start";
       startInput.value = info.start || "";
-      const endInput = document.createElement("input");
-      endInput.type = "text";
       endInput.name = `${day}__end`;
-      endInput.placeholder = "End";
       endInput.value = info.end || "";
-      timeWrap.append(startInput, endInput);
-      header.append(title, timeWrap);
-
-      const textarea = document.createElement("textarea");
       textarea.name = `${day}__content`;
-      textarea.placeholder = "";
       textarea.value = info.content || "";
-
-      container.append(header, textarea);
       grid.appendChild(container);
     });
-    form.appendChild(grid);
+    form.replaceChildren(grid);
     setPanelVisibility(panel, true);
     state.flyouts.weekly = true;
   };
@@ -4031,10 +4077,16 @@ import {
     return text && text !== "—" ? text : "";
   };
 
+  const templateFieldNameCache = new Map();
+
   const normalizeTemplateFieldName = (value) => {
-    return String(value || "")
-      .toLowerCase()
-      .replace(/[^a-z0-9]/g, "");
+    const key = String(value || "");
+    let normalized = templateFieldNameCache.get(key);
+    if (normalized === undefined) {
+      normalized = key.toLowerCase().replace(/[^a-z0-9]/g, "");
+      templateFieldNameCache.set(key, normalized);
+    }
+    return normalized;
   };
 
   const buildTemplateRowLookup = (rowValue) => {
@@ -4149,30 +4201,29 @@ import {
 
   const isEdgeTemplateType = (type) => String(type || "").startsWith("edge-");
 
+  const EMAIL_TEMPLATE_RECIPIENT_RESOLVERS = new Map([
+    [
+      "neo-compliance",
+      (context) => ({ to: context.managerEmail || context.manager || "", cc: "" }),
+    ],
+    ["cori-template", () => ({ to: "Nancy.Major@aus.com", cc: "" })],
+  ]);
+
+  const resolveEdgeTemplateRecipients = (context) => ({
+    to: context.email || "",
+    cc: context.managerEmail || "",
+  });
+
+  const resolveDefaultTemplateRecipients = (context) => ({
+    to: context.manager || context.email || "",
+    cc: "",
+  });
+
   const getEmailTemplateRecipients = (type, context) => {
-    const safeContext = context || {};
-    if (type === "neo-compliance") {
-      return {
-        to: safeContext.managerEmail || safeContext.manager || "",
-        cc: "",
-      };
-    }
-    if (type === "cori-template") {
-      return {
-        to: "Nancy.Major@aus.com",
-        cc: "",
-      };
-    }
-    if (isEdgeTemplateType(type)) {
-      return {
-        to: safeContext.email || "",
-        cc: safeContext.managerEmail || "",
-      };
-    }
-    return {
-      to: safeContext.manager || safeContext.email || "",
-      cc: "",
-    };
+    const resolve =
+      EMAIL_TEMPLATE_RECIPIENT_RESOLVERS.get(type) ||
+      (isEdgeTemplateType(type) ? resolveEdgeTemplateRecipients : resolveDefaultTemplateRecipients);
+    return resolve(context || {});
   };
 
   const getEmailTemplateConfigForType = (type) => {
@@ -4257,11 +4308,20 @@ import {
     return base ? `custom-${base}` : "";
   };
 
+  const emailTemplateDefinitionsCache = { source: null, definitions: [], byId: new Map() };
+
+  const invalidateEmailTemplateDefinitions = () => {
+    emailTemplateDefinitionsCache.source = null;
+  };
+
   const getAllEmailTemplateDefinitions = () => {
     const customTypes =
       state.emailTemplates && state.emailTemplates.customTypes
         ? state.emailTemplates.customTypes
         : {};
+    if (emailTemplateDefinitionsCache.source === customTypes) {
+      return emailTemplateDefinitionsCache.definitions;
+    }
     const customDefs = Object.keys(customTypes)
       .map((id) => ({
         id,
@@ -4269,23 +4329,35 @@ import {
       }))
       .filter((item) => !!item.id)
       .sort((a, b) => a.label.localeCompare(b.label));
-    return [...BUILTIN_EMAIL_TEMPLATE_DEFINITIONS, ...customDefs];
+    emailTemplateDefinitionsCache.source = customTypes;
+    emailTemplateDefinitionsCache.definitions = [
+      ...BUILTIN_EMAIL_TEMPLATE_DEFINITIONS,
+      ...customDefs,
+    ];
+    emailTemplateDefinitionsCache.byId = new Map(
+      emailTemplateDefinitionsCache.definitions.map((item) => [item.id, item]),
+    );
+    return emailTemplateDefinitionsCache.definitions;
+  };
+
+  const getEmailTemplateDefinition = (type) => {
+    getAllEmailTemplateDefinitions();
+    return emailTemplateDefinitionsCache.byId.get(type) || null;
   };
 
   const getEmailTemplateTypeLabel = (type) => {
-    const match = getAllEmailTemplateDefinitions().find((item) => item.id === type);
+    const match = getEmailTemplateDefinition(type);
     return match ? match.label : sanitizeTemplateDisplayName(type) || "Template";
   };
 
   const makeUniqueCustomTemplateTypeId = (label) => {
     const base = buildCustomTemplateTypeId(label);
     if (!base) return "";
-    const existing = new Set(getAllEmailTemplateDefinitions().map((item) => item.id));
-    if (!existing.has(base)) return base;
+    if (!getEmailTemplateDefinition(base)) return base;
     let index = 2;
     while (index < 1000) {
       const next = `${base}-${index}`;
-      if (!existing.has(next)) return next;
+      if (!getEmailTemplateDefinition(next)) return next;
       index += 1;
     }
     return "";
@@ -4305,10 +4377,23 @@ import {
       fragment.appendChild(option);
     });
     select.appendChild(fragment);
-    const hasSelected = definitions.some((item) => item.id === selected);
+    const hasSelected = !!getEmailTemplateDefinition(selected);
     select.value = hasSelected ? selected : definitions[0]?.id || "neo-compliance";
   };
 
+  let longDateFormatter = null;
+
+  const formatLongDate = (date = new Date()) => {
+    if (!longDateFormatter) {
+      longDateFormatter = new Intl.DateTimeFormat(undefined, {
+        month: "long",
+        day: "numeric",
+        year: "numeric",
+      });
+    }
+    return longDateFormatter.format(date);
+  };
+
   const formatTemplateDate = (value) => {
     const text = toTemplateValue(value);
     if (/^\d{4}-\d{2}-\d{2}$/.test(text)) return isoToSlashDate(text);
@@ -4684,7 +4769,7 @@ import {
 
   const getEmailTemplateContext = () => {
     const cardId = state.kanban.detailsCardId;
-    const card = cardId ? state.kanban.cards.find((item) => item.uuid === cardId) : null;
+    const card = cardId ? getKanbanCard(cardId) : null;
     return buildEmailTemplateContextFromCardRow(card, state.kanban.detailsRow || {});
   };
 
@@ -5048,11 +5133,7 @@ import {
     const manager = templateContext.manager || "[Manager]";
     const branch = templateContext.branch || "[Branch]";
     const job = templateContext.job || "[Job]";
-    const today = new Date().toLocaleDateString(undefined, {
-      month: "long",
-      day: "numeric",
-      year: "numeric",
-    });
+    const today = formatLongDate();
     const defaults = buildDefaultEmailTemplateByType(
       type,
       templateContext,
@@ -5101,11 +5182,7 @@ import {
   };
 
   const buildEmailTemplateDashboardDefaults = (type) => {
-    const today = new Date().toLocaleDateString(undefined, {
-      month: "long",
-      day: "numeric",
-      year: "numeric",
-    });
+    const today = formatLongDate();
     const sampleContext = {
       name: "[Candidate Name]",
       eid: "[EID]",
@@ -5248,7 +5325,7 @@ import {
         : {};
     const latestRow = await getLatestCandidateRow(candidateId, fallbackRow, sourceId);
     if (!latestRow || typeof latestRow !== "object") return;
-    const card = state.kanban.cards.find((item) => item.uuid === candidateId) || null;
+    const card = getKanbanCard(candidateId);
     emailTemplateContext = {
       ...buildEmailTemplateContextFromCardRow(card, latestRow),
       sourceId,
@@ -5381,9 +5458,7 @@ import {
   };
 
   const toEmlLineEndings = (value) => {
-    return String(value || "")
-      .replace(/\r\n?/g, "\n")
-      .replace(/\n/g, "\r\n");
+    return String(value || "").replace(/\r\n?|\n/g, "\r\n");
   };
 
   const buildEmailDraftEml = ({ to, cc, subject, textBody, htmlBody }) => {
@@ -5404,12 +5479,12 @@ import {
     lines.push('Content-Type: text/plain; charset="UTF-8"');
     lines.push("Content-Transfer-Encoding: 8bit");
     lines.push("");
-    lines.push(String(textBody || "").replace(/\r\n?/g, "\n"));
+    lines.push(String(textBody || ""));
     lines.push(`--${boundary}`);
     lines.push('Content-Type: text/html; charset="UTF-8"');
     lines.push("Content-Transfer-Encoding: 8bit");
     lines.push("");
-    lines.push(String(htmlBody || "").replace(/\r\n?/g, "\n"));
+    lines.push(String(htmlBody || ""));
     lines.push(`--${boundary}--`);
     lines.push("");
     return toEmlLineEndings(lines.join("\n"));
@@ -5577,8 +5652,8 @@ import {
     emailTemplateLastGeneratedDraft = null;
     emailTemplateLastGeneratedHtmlBody = "";
     emailTemplateBackdropMouseDown = false;
-    modal.classList.remove("hidden");
     applyEmailTemplateDraft({ force: true });
+    modal.classList.remove("hidden");
     startEmailTemplateAutoRefresh();
     if (recipientInput) recipientInput.focus();
   };
@@ -5717,7 +5792,7 @@ import {
     if (!typeInput || !toInput || !ccInput || !subjectInput || !bodyInput || !htmlBodyInput) return;
     const allDefs = getAllEmailTemplateDefinitions();
     const fallbackType = allDefs[0]?.id || "neo-compliance";
-    const hasActive = allDefs.some((item) => item.id === state.emailTemplates.activeType);
+    const hasActive = !!getEmailTemplateDefinition(state.emailTemplates.activeType);
     const nextType = hasActive ? state.emailTemplates.activeType : fallbackType;
     state.emailTemplates.activeType = nextType;
     renderEmailTemplateTypeSelectOptions("template-dashboard-type", nextType);
@@ -5836,7 +5911,7 @@ import {
     const typeInput = $("template-dashboard-type");
     const type = typeInput ? typeInput.value : "neo-compliance";
     const allDefs = getAllEmailTemplateDefinitions();
-    state.emailTemplates.activeType = allDefs.some((item) => item.id === type)
+    state.emailTemplates.activeType = getEmailTemplateDefinition(type)
       ? type
       : allDefs[0]?.id || "neo-compliance";
     renderEmailTemplateDashboard();
@@ -5873,6 +5948,7 @@ import {
     delete state.emailTemplates.items[type];
     if (!EMAIL_TEMPLATE_TYPES.includes(type)) {
       delete state.emailTemplates.customTypes[type];
+      invalidateEmailTemplateDefinitions();
       const allDefs = getAllEmailTemplateDefinitions();
       state.emailTemplates.activeType = allDefs[0]?.id || "neo-compliance";
     }
@@ -5903,6 +5979,7 @@ import {
       return;
     }
     state.emailTemplates.customTypes[nextType] = label;
+    invalidateEmailTemplateDefinitions();
     const defaults = getEmailTemplateConfigForType(nextType);
     const preview = buildEmailTemplateDashboardDefaults(nextType);
     state.emailTemplates.items[nextType] = sanitizeEmailTemplateRecord({
@@ -5942,6 +6019,26 @@ import {
     }
   };
 
+  const TODO_ACTION_BUTTONS = {
+    complete: { className: "todo-complete", label: "Complete", disabled: false },
+    completed: { className: "todo-complete", label: "Completed", disabled: true },
+    delete: { className: "todo-delete", label: "Delete", disabled: false },
+  };
+  const todoActionButtonTemplates = new Map();
+
+  const createTodoActionButton = (role) => {
+    let template = todoActionButtonTemplates.get(role);
+    if (!template) {
+      const config = TODO_ACTION_BUTTONS[role];
+      template = document.createElement("button");
+      template.className = config.className;
+      template.textContent = config.label;
+      template.disabled = config.disabled;
+      todoActionButtonTemplates.set(role, template);
+    }
+    return template.cloneNode(true);
+  };
+
   const renderTodoList = () => {
     const todoList = $("todo-list");
     if (!todoList) return;
@@ -5959,15 +6056,10 @@ import {
       const actions = document.createElement("div");
       actions.className = "todo-actions";
 
-      const completeBtn = document.createElement("button");
-      completeBtn.className = "todo-complete";
-      completeBtn.textContent = todo.done ? "Completed" : "Complete";
+      const completeBtn = createTodoActionButton(todo.done ? "completed" : "complete");
       completeBtn.dataset.idx = idx;
-      if (todo.done) completeBtn.disabled = true;
 
-      const deleteBtn = document.createElement("button");
-      deleteBtn.className = "todo-delete";
-      deleteBtn.textContent = "Delete";
+      const deleteBtn = createTodoActionButton("delete");
       deleteBtn.dataset.idx = idx;
 
       actions.append(completeBtn, deleteBtn);
@@ -5996,8 +6088,7 @@ import {
           invalidateKanbanCache();
           state.kanban.loaded = true;
           state.todos = Array.isArray(snapshot.todos) ? snapshot.todos : [];
-          renderKanbanBoard();
-          renderKanbanSettings();
+          scheduleKanbanRender();
           if (state.kanban.detailsCardId) {
             await refreshDetailsRow(state.kanban.detailsCardId);
             renderDetailsDrawer();
@@ -6162,17 +6253,98 @@ import {
     input.placeholder = label;
   };
 
+  const rowSearchTextCache = new WeakMap();
+
+  const getRowSearchText = (row, columns) => {
+    let text = rowSearchTextCache.get(row);
+    if (text === undefined) {
+      text = columns.map((col) => String(row[col] ?? "").toLowerCase()).join("\n");
+      rowSearchTextCache.set(row, text);
+    }
+    return text;
+  };
+
+  const rowSearchTextColumnCache = new WeakMap();
+
+  const getRowSearchTextColumn = (rows, columns) => {
+    let texts = rowSearchTextColumnCache.get(rows);
+    if (!texts) {
+      texts = rows.map((row) => getRowSearchText(row, columns));
+      rowSearchTextColumnCache.set(rows, texts);
+    }
+    return texts;
+  };
+
+  const ROW_SEARCH_GRAM = 3;
+  const rowSearchGramIndexCache = new WeakMap();
+
+  const getRowSearchGramIndex = (rows, columns) => {
+    let index = rowSearchGramIndexCache.get(rows);
+    if (index) return index;
+    index = new Map();
+    getRowSearchTextColumn(rows, columns).forEach((text, position) => {
+      for (let i = 0; i + ROW_SEARCH_GRAM <= text.length; i += 1) {
+        const gram = text.slice(i, i + ROW_SEARCH_GRAM);
+        let postings = index.get(gram);
+        if (!postings) {
+          postings = [];
+          index.set(gram, postings);
+        }
+        if (postings[postings.length - 1] !== position) postings.push(position);
+      }
+    });
+    rowSearchGramIndexCache.set(rows, index);
+    return index;
+  };
+
+  const findRowSearchCandidates = (rows, columns, query) => {
+    if (query.length < ROW_SEARCH_GRAM) return null;
+    const index = getRowSearchGramIndex(rows, columns);
+    let smallest = null;
+    for (let i = 0; i + ROW_SEARCH_GRAM <= query.length; i += 1) {
+      const postings = index.get(query.slice(i, i + ROW_SEARCH_GRAM));
+      if (!postings) return [];
+      if (!smallest || postings.length < smallest.length) smallest = postings;
+    }
+    return smallest;
+  };
+
+  const emptyRowSearchCache = () => ({ rows: null, query: "", positions: [], result: [] });
+
+  const filterRowsBySearch = (rows, columns, query, cache) => {
+    const sameRows = cache.rows === rows;
+    if (sameRows && cache.query === query) return cache;
+    const texts = getRowSearchTextColumn(rows, columns);
+    const candidates =
+      sameRows && query.includes(cache.query)
+        ? cache.positions
+        : findRowSearchCandidates(rows, columns, query);
+    const positions = [];
+    if (candidates) {
+      for (let i = 0; i < candidates.length; i += 1) {
+        if (texts[candidates[i]].includes(query)) positions.push(candidates[i]);
+      }
+    } else {
+      for (let i = 0; i < texts.length; i += 1) {
+        if (texts[i].includes(query)) positions.push(i);
+      }
+    }
+    const result = positions.map((position) => rows[position]);
+    return { rows, query, positions, result };
+  };
+
+  let filteredDatabaseRowsCache = emptyRowSearchCache();
+
   const getFilteredDatabaseRows = () => {
     const query = state.data.query.trim().toLowerCase();
     if (!query) return state.data.rows;
-    return state.data.rows.filter((row) =>
-      state.data.columns.some((col) => {
-        const value = row[col];
-        return String(value ?? "")
-          .toLowerCase()
-          .includes(query);
-      }),
+    filteredDatabaseRowsCache = filterRowsBySearch(
+      state.data.rows,
+      state.data.columns,
+      query,
+      filteredDatabaseRowsCache,
     );
+    return filteredDatabaseRowsCache.result;
   };
 
   const getPagedDatabaseRows = () => {
@@ -6294,9 +6466,7 @@ import {
 
   const buildEmailTemplateContextFromDatabaseRow = (row) => {
     const candidateId = getDatabaseCandidateId(row);
-    const card = candidateId
-      ? state.kanban.cards.find((item) => item.uuid === candidateId) || null
-      : null;
+    const card = candidateId ? getKanbanCard(candidateId) : null;
     return buildEmailTemplateContextFromCardRow(card, row);
   };
 
@@ -6437,6 +6607,15 @@ import {
     if (shouldRender) renderDatabaseTable();
   };
 
+  const createRowCheckboxCell = (className) => {
+    const td = document.createElement("td");
+    const checkbox = document.createElement("input");
+    checkbox.type = "checkbox";
+    checkbox.className = className;
+    td.appendChild(checkbox);
+    return td;
+  };
+
   const renderDatabaseTable = () => {
     const table = $("db-table");
     if (!table) return;
@@ -6446,9 +6625,7 @@ import {
 
     const filteredRows = getFilteredDatabaseRows();
     const rows = getPagedDatabaseRows();
-
-    thead.innerHTML = "";
-    tbody.innerHTML = "";
+    const { columns, selectedRowIds, readOnly } = state.data;
 
     const headerRow = document.createElement("tr");
     const selectTh = document.createElement("th");
@@ -6456,47 +6633,48 @@ import {
     selectAll.type = "checkbox";
     selectAll.className = "table-checkbox";
     selectAll.dataset.selectAll = "1";
-    selectAll.checked =
-      rows.length > 0 && rows.every((row) => state.data.selectedRowIds.has(row.__rowId));
-    selectAll.disabled = state.data.readOnly;
+    selectAll.checked = rows.length > 0 && rows.every((row) => selectedRowIds.has(row.__rowId));
+    selectAll.disabled = readOnly;
     selectTh.appendChild(selectAll);
     headerRow.appendChild(selectTh);
 
-    state.data.columns.forEach((col) => {
+    columns.forEach((col) => {
       const th = document.createElement("th");
       th.textContent = col;
       headerRow.appendChild(th);
     });
-    thead.appendChild(headerRow);
+    thead.replaceChildren(headerRow);
 
     if (!rows.length) {
       const emptyRow = document.createElement("tr");
       const td = document.createElement("td");
-      td.colSpan = state.data.columns.length + 1;
+      td.colSpan = columns.length + 1;
       td.className = "data-table__empty";
       td.textContent = "No rows found.";
       emptyRow.appendChild(td);
-      tbody.appendChild(emptyRow);
+      tbody.replaceChildren(emptyRow);
       updateDatabaseMeta(filteredRows.length);
       updatePaginationControls(filteredRows.length);
       updateDbDeleteButton();
       return;
     }
 
+    // Read-only sources cannot delete rows, so skip building a disabled checkbox per row.
+    const selectTdTemplate = readOnly
+      ? document.createElement("td")
+      : createRowCheckboxCell("table-checkbox db-row-checkbox");
     const fragment = document.createDocumentFragment();
     rows.forEach((row) => {
       const tr = document.createElement("tr");
-      const selectTd = document.createElement("td");
-      const checkbox = document.createElement("input");
-      checkbox.type = "checkbox";
-      checkbox.className = "table-checkbox db-row-checkbox";
-      checkbox.dataset.rowId = row.__rowId;
-      checkbox.checked = state.data.selectedRowIds.has(row.__rowId);
-      checkbox.disabled = state.data.readOnly;
-      selectTd.appendChild(checkbox);
+      const selectTd = selectTdTemplate.cloneNode(true);
+      const checkbox = selectTd.firstChild;
+      if (checkbox) {
+        checkbox.dataset.rowId = row.__rowId;
+        checkbox.checked = selectedRowIds.has(row.__rowId);
+      }
       tr.appendChild(selectTd);
 
-      state.data.columns.forEach((col) => {
+      columns.forEach((col) => {
         const td = document.createElement("td");
         const value = row[col];
         td.textContent = value === null || value === undefined ? "" : String(value);
@@ -6504,7 +6682,7 @@ import {
       });
       fragment.appendChild(tr);
     });
-    tbody.appendChild(fragment);
+    tbody.replaceChildren(fragment);
 
     updateDatabaseMeta(filteredRows.length);
     updatePaginationControls(filteredRows.length);
@@ -6662,17 +6840,18 @@ import {
     if (clearBtn) clearBtn.disabled = !hasSelection;
   };
 
+  let filteredUniformRowsCache = emptyRowSearchCache();
+
   const getFilteredUniformRows = () => {
     const query = state.uniforms.query.trim().toLowerCase();
     if (!query) return state.uniforms.rows;
-    return state.uniforms.rows.filter((row) =>
-      state.uniforms.columns.some((col) => {
-        const value = row[col];
-        return String(value ?? "")
-          .toLowerCase()
-          .includes(query);
-      }),
+    filteredUniformRowsCache = filterRowsBySearch(
+      state.uniforms.rows,
+      state.uniforms.columns,
+      query,
+      filteredUniformRowsCache,
     );
+    return filteredUniformRowsCache.result;
   };
 
   const getPagedUniformRows = () => {
@@ -6717,9 +6896,7 @@ import {
 
     const filteredRows = getFilteredUniformRows();
     const rows = getPagedUniformRows();
-
-    thead.innerHTML = "";
-    tbody.innerHTML = "";
+    const { columns, selectedRowIds } = state.uniforms;
 
     const headerRow = document.createElement("tr");
     const selectTh = document.createElement("th");
@@ -6727,45 +6904,42 @@ import {
     selectAll.type = "checkbox";
     selectAll.className = "table-checkbox";
     selectAll.dataset.uniformSelectAll = "1";
-    selectAll.checked =
-      rows.length > 0 && rows.every((row) => state.uniforms.selectedRowIds.has(row.__rowId));
+    selectAll.checked = rows.length > 0 && rows.every((row) => selectedRowIds.has(row.__rowId));
     selectTh.appendChild(selectAll);
     headerRow.appendChild(selectTh);
 
-    state.uniforms.columns.forEach((col) => {
+    columns.forEach((col) => {
       const th = document.createElement("th");
       th.textContent = col;
       headerRow.appendChild(th);
     });
-    thead.appendChild(headerRow);
+    thead.replaceChildren(headerRow);
 
     if (!rows.length) {
       const emptyRow = document.createElement("tr");
       const td = document.createElement("td");
-      td.colSpan = state.uniforms.columns.length + 1;
+      td.colSpan = columns.length + 1;
       td.className = "data-table__empty";
       td.textContent = "No rows found.";
       emptyRow.appendChild(td);
-      tbody.appendChild(emptyRow);
+      tbody.replaceChildren(emptyRow);
       updateUniformMeta(filteredRows.length);
       updateUniformPagination(filteredRows.length);
       updateUniformDeleteButton();
       return;
     }
 
+    const selectTdTemplate = createRowCheckboxCell("table-checkbox uniform-row-checkbox");
     const fragment = document.createDocumentFragment();
     rows.forEach((row) => {
       const tr = document.createElement("tr");
-      const selectTd = document.createElement("td");
-      const checkbox = document.createElement("input");
-      checkbox.type = "checkbox";
-      checkbox.className = "table-checkbox uniform-row-checkbox";
+      const selectTd = selectTdTemplate.cloneNode(true);
+      const checkbox = selectTd.firstChild;
       checkbox.dataset.rowId = row.__rowId;
-      checkbox.checked = state.uniforms.selectedRowIds.has(row.__rowId);
-      selectTd.appendChild(checkbox);
+      checkbox.checked = selectedRowIds.has(row.__rowId);
       tr.appendChild(selectTd);
 
-      state.uniforms.columns.forEach((col) => {
+      columns.forEach((col) => {
         const td = document.createElement("td");
         const value = row[col];
         td.textContent = value === null || value === undefined ? "" : String(value);
@@ -6773,7 +6947,7 @@ import {
       });
       fragment.appendChild(tr);
     });
-    tbody.appendChild(fragment);
+    tbody.replaceChildren(fragment);
 
     updateUniformMeta(filteredRows.length);
     updateUniformPagination(filteredRows.length);
@@ -7285,7 +7459,9 @@ import {
 
   const switchPage = (page) => {
     if (!page) return;
-    const target = $(`page-${page}`) ? page : "dashboard";
+    const requested = $(`page-${page}`);
+    const target = requested ? page : "dashboard";
+    const targetSection = requested || $("page-dashboard");
     if (state.page === "database" && target !== "database") {
       clearDatabaseSelection(false);
     }
@@ -7294,11 +7470,15 @@ import {
     }
     state.page = target;
     document.body.dataset.page = target;
-    document.querySelectorAll(".page").forEach((section) => {
-      section.classList.toggle("page--active", section.id === `page-${target}`);
+    document.querySelectorAll(".page--active").forEach((section) => {
+      if (section !== targetSection) section.classList.remove("page--active");
+    });
+    targetSection.classList.add("page--active");
+    document.querySelectorAll(".nav-item--active").forEach((btn) => {
+      if (btn.dataset.page !== target) btn.classList.remove("nav-item--active");
     });
-    document.querySelectorAll(".nav-item").forEach((btn) => {
-      btn.classList.toggle("nav-item--active", btn.dataset.page === target);
+    document.querySelectorAll(`.nav-item[data-page="${target}"]`).forEach((btn) => {
+      btn.classList.add("nav-item--active");
     });
     const pageHandlers = {
       dashboard: renderKanbanBoard,
@@ -7312,7 +7492,7 @@ import {
     const handler = pageHandlers[target];
     if (handler) handler();
     updateUndoRedoButtons();
-    bindTopbarAutoHide();
+    bindTopbarAutoHide(targetSection);
   };
 
   const setupEventListeners = () => {
@@ -7598,6 +7778,7 @@ import {
     const uniformAddInseam = $("uniform-add-inseam");
     if (dbSearch) {
       const onSearch = debounce(() => {
+        if (dbSearch.value === state.data.query) return;
         state.data.query = dbSearch.value;
         state.data.page = 1;
         renderDatabaseTable();
@@ -7652,7 +7833,10 @@ import {
             getPagedDatabaseRows().forEach((row) => next.delete(row.__rowId));
             state.data.selectedRowIds = next;
           }
-          renderDatabaseTable();
+          dbTable.querySelectorAll(".db-row-checkbox").forEach((checkbox) => {
+            checkbox.checked = target.checked;
+          });
+          updateDbDeleteButton();
           return;
         }
         if (target.classList.contains("db-row-checkbox")) {
@@ -7670,6 +7854,7 @@ import {
 
     if (uniformSearch) {
       const onUniformSearch = debounce(() => {
+        if (uniformSearch.value === state.uniforms.query) return;
         state.uniforms.query = uniformSearch.value;
         state.uniforms.page = 1;
         renderUniformTable();
@@ -7725,7 +7910,10 @@ import {
             getPagedUniformRows().forEach((row) => next.delete(row.__rowId));
             state.uniforms.selectedRowIds = next;
           }
-          renderUniformTable();
+          uniformTable.querySelectorAll(".uniform-row-checkbox").forEach((checkbox) => {
+            checkbox.checked = target.checked;
+          });
+          updateUniformDeleteButton();
           return;
         }
         if (target.classList.contains("uniform-row-checkbox")) {
@@ -7741,14 +7929,17 @@ import {
       });
     }
 
-    window.addEventListener("resize", () => {
-      if (state.flyouts.weekly) positionFlyout($("weekly-panel"));
-      if (state.flyouts.todo) positionFlyout($("todo-panel"));
-    });
+    window.addEventListener(
+      "resize",
+      debounce(() => {
+        if (state.flyouts.weekly) positionFlyout($("weekly-panel"));
+        if (state.flyouts.todo) positionFlyout($("todo-panel"));
+      }, 100),
+    );
 
     document.querySelectorAll(".nav-item").forEach((button) => {
       button.addEventListener("click", () => {
-        switchPage(button.dataset.page);
+        if (button.dataset.page !== state.page) switchPage(button.dataset.page);
         const appRoot = document.querySelector(".app");
         if (appRoot && appRoot.classList.contains("app--drawer-open") && window.innerWidth <= 900) {
           appRoot.classList.remove("app--drawer-open");
@@ -7777,6 +7968,7 @@ import {
     observeNewPasswordFields();
     setupEventListeners();
     initKanbanWheelScroll();
+    initKanbanCardEvents();
     setupFlyoutDismiss();
     setupTodoUI();
     initCandidateInputs();
@@ -7790,9 +7982,12 @@ import {
     const ok = await requireStartupAuthentication();
     if (!ok) return;
 
-    await loadEmailTemplateSettings();
+    // Templates are only needed once a candidate or the templates page is opened,
+    // so load them alongside the dashboard instead of ahead of it.
+    const emailTemplatesLoad = loadEmailTemplateSettings();
     switchPage("dashboard");
     await loadDashboardData();
+    await emailTemplatesLoad;
     await checkDatabaseIntegrity();
   };
 
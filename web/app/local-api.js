@@ -500,6 +500,25 @@ if (existingApi) {
       }
       return { cards: [] };
     },
+    kanbanMoveCard: async (cardId, columnId, cardIds, fromColumnId, fromCardIds) => {
+      requireAuth();
+      if (!tauriBridge || typeof tauriBridge.dbKanbanMoveCard !== "function") {
+        return { cards: [] };
+      }
+      const result = await tauriBridge.dbKanbanMoveCard({
+        password: activePassword,
+        cardId: String(cardId || ""),
+        columnId: String(columnId || ""),
+        cardIds: Array.isArray(cardIds) ? cardIds : [],
+        fromColumnId: String(fromColumnId || ""),
+        fromCardIds: Array.isArray(fromCardIds) ? fromCardIds : [],
+      });
+      if (result && typeof result === "object" && !Array.isArray(result)) {
+        const cards = Array.isArray(result.cards) ? result.cards : [];
+        return { cards };
+      }
+      return { cards: [] };
+    },
 
     weeklyGet: async () => {
       requireAuth();
@@ -830,7 +849,7 @@ if (existingApi) {
       requireAuth();
       if (tauriBridge && typeof tauriBridge.pickTextFile === "function") {
         const result = await tauriBridge.pickTextFile();
-        if (result && (result.ok || result.canceled)) return result;
+        if (result && (result.ok || result.canceled || result.error)) return result;
       }
       return { ok: false, canceled: true };
     },
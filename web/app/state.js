@@ -16,6 +16,7 @@ export const state = {
     cache: {
       columns: null,
       cardsByColumn: new Map(),
+      cardsById: new Map(),
       dirty: true,
     },
     dom: {
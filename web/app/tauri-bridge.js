@@ -458,6 +458,29 @@
         return null;
       }
     },
+    dbKanbanMoveCard: async ({
+      password,
+      cardId,
+      columnId,
+      cardIds,
+      fromColumnId,
+      fromCardIds,
+    }) => {
+      try {
+        return await call("db_kanban_move_card", {
+          payload: {
+            password,
+            card_id: cardId,
+            column_id: columnId,
+            card_ids: cardIds,
+            from_column_id: fromColumnId,
+            from_card_ids: fromCardIds,
+          },
+        });
+      } catch (error) {
+        return null;
+      }
+    },
     dbUniformsAddItem: async ({ password, payload }) => {
       try {
         return await call("db_uniforms_add_item", {
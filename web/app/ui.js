@@ -86,22 +86,22 @@ export const withOptimisticUpdate = async ({
     if (typeof apply === "function") apply();
     try {
       const result = await request();
-      if (result && result.ok === false) {
-        throw new Error(result.message || result.error || "Request failed");
+      if (!result || result.ok !== false) {
+        if (typeof onSuccess === "function") onSuccess(result);
+        return result;
       }
-      if (typeof onSuccess === "function") onSuccess(result);
-      return result;
-    } catch (error) {
-      if (typeof rollback === "function") rollback();
-      if (onErrorMessage) {
-        showToast({
-          message: onErrorMessage,
-          actionLabel: "Retry",
-          onAction: typeof onRetry === "function" ? onRetry : attempt,
-        });
-      }
-      return null;
+    } catch (_error) {
+      // Rejected requests roll back the same way as { ok: false } results.
+    }
+    if (typeof rollback === "function") rollback();
+    if (onErrorMessage) {
+      showToast({
+        message: onErrorMessage,
+        actionLabel: "Retry",
+        onAction: typeof onRetry === "function" ? onRetry : attempt,
+      });
     }
+    return null;
   };
   return attempt();
 };
@@ -115,12 +115,15 @@ export const positionFlyout = (panel) => {
   panel.style.height = `calc(100% - ${top + 24}px)`;
 };
 
+const pendingPanelHides = new WeakMap();
+
 export const setPanelVisibility = (panel, isOpen) => {
   if (!panel) return;
-  if (panel.dataset.animTimer) {
-    clearTimeout(Number(panel.dataset.animTimer));
-    delete panel.dataset.animTimer;
-  }
+  const cancelPendingHide = pendingPanelHides.get(panel);
+  if (cancelPendingHide) cancelPendingHide();
+  const isHidden = panel.classList.contains("hidden");
+  const alreadySettled = isOpen ? !isHidden && panel.classList.contains("is-open") : isHidden;
+  if (alreadySettled) return;
   if (isOpen) {
     panel.classList.remove("hidden");
     requestAnimationFrame(() => {
@@ -131,20 +134,25 @@ export const setPanelVisibility = (panel, isOpen) => {
   }
   panel.classList.remove("is-open");
   panel.setAttribute("aria-hidden", "true");
+  let timer = null;
+  const finish = () => {
+    window.clearTimeout(timer);
+    panel.removeEventListener("transitionend", onEnd);
+    pendingPanelHides.delete(panel);
+  };
   const onEnd = (event) => {
     if (event.propertyName !== "opacity") return;
     panel.classList.add("hidden");
-    panel.removeEventListener("transitionend", onEnd);
+    finish();
   };
   panel.addEventListener("transitionend", onEnd);
-  const timer = window.setTimeout(() => {
+  timer = window.setTimeout(() => {
     if (!panel.classList.contains("is-open")) {
       panel.classList.add("hidden");
     }
-    panel.removeEventListener("transitionend", onEnd);
-    delete panel.dataset.animTimer;
+    finish();
   }, 280);
-  panel.dataset.animTimer = String(timer);
+  pendingPanelHides.set(panel, finish);
 };
 
 export const showMessageModal = (title, message) => {
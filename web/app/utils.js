@@ -91,9 +91,15 @@ export const formatWeeklyHours = (minutes) => {
 };
 
 export const isDateLikeValid = (value) => /^\d{2}\/\d{2}\/(\d{2}|\d{4})$/.test(value);
-export const isFullDateValid = (value) => /^\d{2}\/\d{2}\/\d{4}$/.test(value);
+const ISO_DATE_PATTERN = /^\d{4}-\d{2}-\d{2}$/;
+const SLASH_DATE_PATTERN = /^\d{2}\/\d{2}\/\d{4}$/;
+
+export const isFullDateValid = (value) => SLASH_DATE_PATTERN.test(value);
 
 export const isoToSlashDate = (value) => {
+  if (typeof value === "string" && ISO_DATE_PATTERN.test(value)) {
+    return `${value.slice(5, 7)}/${value.slice(8, 10)}/${value.slice(0, 4)}`;
+  }
   const parts = String(value || "").split("-");
   if (parts.length !== 3) return value;
   const [year, month, day] = parts;
@@ -101,6 +107,9 @@ export const isoToSlashDate = (value) => {
 };
 
 export const slashToIsoDate = (value) => {
+  if (SLASH_DATE_PATTERN.test(value)) {
+    return `${value.slice(6, 10)}-${value.slice(0, 2)}-${value.slice(3, 5)}`;
+  }
   const [month, day, year] = value.split("/");
   if (!month || !day || !year) return value;
   return `${year}-${month}-${day}`;
@@ -116,12 +125,19 @@ export const normalizeValue = (value) => {
 
 export const hasValue = (value) => normalizeValue(value) !== "";
 
+const MVR_FLAG_LABELS = new Map([
+  ["", ""],
+  ["1", "Yes"],
+  ["true", "Yes"],
+  ["yes", "Yes"],
+  ["0", "No"],
+  ["false", "No"],
+  ["no", "No"],
+]);
+
 export const formatMvrFlag = (value) => {
-  const text = normalizeValue(value).toLowerCase();
-  if (!text) return "";
-  if (["1", "true", "yes"].includes(text)) return "Yes";
-  if (["0", "false", "no"].includes(text)) return "No";
-  return normalizeValue(value);
+  const text = normalizeValue(value);
+  return MVR_FLAG_LABELS.get(text.toLowerCase()) ?? text;
 };
 
 export const sanitizeTimeInput = (input) => {